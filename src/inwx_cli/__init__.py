@@ -0,0 +1,6 @@
+# inwx_cli/__init__.py
+
+from .client import Client
+from .exceptions import INWXAPIError
+
+__all__ = ["Client", "INWXAPIError"]
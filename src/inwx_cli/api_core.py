@@ -8,6 +8,9 @@ CLI_INTERNAL_ARGS = {
     "command",
     "func",
     "api_method",
+    "no_cache",
+    "trace",
+    "trace_endpoint",
 }
 
 
@@ -15,11 +18,15 @@ def kebab(name: str) -> str:
     return re.sub(r"([a-z])([A-Z])", r"\1-\2", name).lower()
 
 
-def extract_api_params(args) -> dict:
+def extract_api_params(args, exclude=()) -> dict:
+    """
+    API parameters of parsed args. exclude names the options a command
+    adds to its method parser, they are never sent to the API.
+    """
     params = {}
 
     for k, v in vars(args).items():
-        if k in CLI_INTERNAL_ARGS:
+        if k in CLI_INTERNAL_ARGS or k in exclude:
             continue
         if v is None:
             continue
@@ -31,12 +38,14 @@ def extract_api_params(args) -> dict:
     return params
 
 
-def handle_generic(api, api_method, args):
-    params = extract_api_params(args)
-
-    result = api.call_api(
+def call_checked(api, api_method, params=None, cached: bool = False) -> dict:
+    """
+    cached answers read-only methods from the session's response cache.
+    """
+    call = api.call_cached if cached else api.call_api
+    result = call(
         api_method=api_method,
-        method_params=params,
+        method_params=params or {},
     )
 
     if result.get("code") not in (1000, 1001):
@@ -45,7 +54,13 @@ def handle_generic(api, api_method, args):
     return result
 
 
-def register_methods(subparsers, methods_dict):
+def handle_generic(api, api_method, args, exclude=()):
+    return call_checked(api, api_method, extract_api_params(args, exclude), cached=True)
+
+
+def register_methods(subparsers, methods_dict) -> dict:
+    parsers = {}
+
     for method_name, info in methods_dict.items():
         parser = subparsers.add_parser(method_name, help=f"{method_name} API call")
 
@@ -54,3 +69,6 @@ def register_methods(subparsers, methods_dict):
             parser.add_argument(flag, **param_info)
 
         parser.set_defaults(api_method=method_name, func=handle_generic)
+        parsers[method_name] = parser
+
+    return parsers
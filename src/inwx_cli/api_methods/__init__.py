@@ -0,0 +1,104 @@
+# inwx_cli/api_methods/__init__.py
+
+"""
+API method definitions for INWX, one JSON spec per namespace
+(account, contact, dnssec, domain, host, nameserver).
+
+Based on official DomRobot API documentation:
+https://www.inwx.com/en/help/apidoc
+
+Each spec maps a method name to its parameters, given as argparse keyword
+arguments. "type" and "action" are stored by name and resolved on load;
+"dest" defaults to the API parameter name. Specs are only read for the
+namespaces actually used and kept for the lifetime of the process.
+"""
+
+import json
+import argparse
+from functools import cache
+from importlib import resources
+
+NAMESPACES = ("account", "contact", "dnssec", "domain", "host", "nameserver")
+
+
+def parse_bool(value: str) -> bool:
+    value = value.lower()
+    if value in ("true", "1", "yes", "y", "t", "on"):
+        return True
+    if value in ("false", "0", "no", "n", "f", "off"):
+        return False
+    raise argparse.ArgumentTypeError(
+        f"invalid boolean value: '{value}' (use true/false)"
+    )
+
+
+TYPES = {
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": parse_bool,
+}
+
+ACTIONS = {
+    "BooleanOptionalAction": argparse.BooleanOptionalAction,
+}
+
+
+def compile_param(name: str, spec: dict) -> dict:
+    param = dict(spec)
+
+    if "type" in param:
+        param["type"] = TYPES[param["type"]]
+    if "action" in param:
+        param["action"] = ACTIONS.get(param["action"], param["action"])
+
+    param.setdefault("dest", name)
+    return param
+
+
+@cache
+def load_methods(namespace: str) -> dict:
+    if namespace not in NAMESPACES:
+        raise KeyError(f"Unknown API namespace '{namespace}'")
+
+    spec = json.loads(
+        resources.files(__package__).joinpath(f"{namespace}.json").read_text(encoding="utf-8")
+    )
+
+    return {
+        method_name: {
+            "params": {
+                name: compile_param(name, param)
+                for name, param in info.get("params", {}).items()
+            }
+        }
+        for method_name, info in spec.items()
+    }
+
+
+def load_all_methods() -> dict:
+    methods = {}
+    for namespace in NAMESPACES:
+        methods.update(load_methods(namespace))
+    return methods
+
+
+def namespaces_for(argv, value_options=("--account",)) -> tuple:
+    """
+    Namespaces needed to parse argv: only the one of the called API method,
+    or all of them (e.g. for --help or non-API commands).
+    value_options are the global options that take a value, their values
+    are skipped (--trace nameserver.jsonl is not a method call).
+    """
+    args = iter(argv)
+
+    for arg in args:
+        if arg in value_options:
+            next(args, None)
+            continue
+
+        namespace, dot, _ = arg.partition(".")
+        if dot and namespace in NAMESPACES:
+            return (namespace,)
+
+    return NAMESPACES
@@ -1,8 +1,14 @@
 # inwx_cli/api_session.py
 
+import json
+import threading
 from INWX.Domrobot import ApiClient
 from .exceptions import INWXAPIError
-from .secrets import SecretStore
+from .secrets import KeyringProvider
+from .tracing import tracer
+
+# Returned by the API once the session cookie is no longer valid
+SESSION_EXPIRED_CODES = (2200,)
 
 
 class INWXSession:
@@ -14,26 +20,88 @@ class INWXSession:
         self.api = ApiClient(api_url=api_url, debug_mode=False)
         self.account = account
         self.username = username
+        self.cache = None
+        self.credentials = KeyringProvider(account, {})
+        self._lock = threading.Lock()
+        self._generation = 0
 
-    def __enter__(self):
-        password = SecretStore.get_password(self.account)
-        secret = SecretStore.get_shared_secret(self.account)
+    def login(self):
+        password = self.credentials.get_password()
+        secret = self.credentials.get_shared_secret()
 
         if not password:
-            raise RuntimeError(f"Missing password in keyring for account '{self.account}'")
+            raise RuntimeError(f"Missing password ({self.credentials.name}) for account '{self.account}'")
 
-        result = self.api.login(
-            self.username,
-            password,
-            secret
-        )
+        with tracer.span("login", account=self.account) as span:
+            result = self.api.login(
+                self.username,
+                password,
+                secret
+            )
+            span.set(code=result.get("code"))
 
         if result.get("code") != 1000:
             raise INWXAPIError(result)
 
-        return self.api
+        self._generation += 1
+
+    def call_api(self, api_method, method_params=None) -> dict:
+        """
+        Same as ApiClient.call_api, but logs in again once if the session
+        expired. Every caller goes through here, so every write invalidates
+        the response cache (if set). Reads are not memoized, bulk commands
+        would otherwise keep every zone they fetched in the cache.
+        """
+        params = method_params or {}
+
+        if self.cache is None or self.cache.cacheable(api_method):
+            return self._call_with_relogin(api_method, params)
+
+        return self.cache.call(self.account, api_method, params, self._call_with_relogin)
+
+    def call_cached(self, api_method, method_params=None) -> dict:
+        """
+        call_api answering read-only methods from the response cache, for
+        the single calls of CLI method commands and the Client.
+        """
+        params = method_params or {}
+
+        if self.cache is None:
+            return self._call_with_relogin(api_method, params)
+
+        return self.cache.call(self.account, api_method, params, self._call_with_relogin)
+
+    def _call_with_relogin(self, api_method, params) -> dict:
+        generation = self._generation
+        result = self._call(api_method, params)
+
+        if result.get("code") in SESSION_EXPIRED_CODES:
+            with tracer.span("retry", method=api_method, account=self.account, reason="session expired"):
+                # Parallel callers share one re-login
+                with self._lock:
+                    if generation == self._generation:
+                        self.login()
+                result = self._call(api_method, params)
+
+        return result
+
+    def _call(self, api_method, params) -> dict:
+        with tracer.span("call_api", method=api_method, account=self.account) as span:
+            result = self.api.call_api(api_method=api_method, method_params=dict(params))
+
+            if tracer.enabled:
+                span.set(code=result.get("code"), bytes=len(json.dumps(result, default=str)))
+
+        return result
+
+    def __enter__(self):
+        self.login()
+        return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        result = self.api.logout()
+        with tracer.span("logout", account=self.account) as span:
+            result = self.api.logout()
+            span.set(code=result.get("code"))
+
         if result.get("code") != 1500:
             raise INWXAPIError(result)
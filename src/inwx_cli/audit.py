@@ -0,0 +1,307 @@
+# inwx_cli/audit.py
+
+import sys
+import json
+import ipaddress
+import statistics
+from collections import defaultdict
+from .api_core import call_checked
+from .bulk import RateLimiter, run_parallel
+from .exceptions import INWXAPIError
+from .records import list_zones
+from .recordset import relative_name
+
+DEFAULT_TTL_FACTOR = 10
+
+# Record types left out of the TTL statistics
+TTL_IGNORED_TYPES = {"SOA", "NS"}
+
+# Registered checks: name -> check(zone, records, registry, args) yielding findings.
+# registry holds the domain.info and dnssec.info results of the zone, None
+# for zones of domains not registered with this account (or failed calls,
+# which are reported as fetch findings).
+CHECKS = {}
+
+# Calls fetched per zone, with the finding message if one fails
+PARTS = {
+    "records": "fetching records failed",
+    "domain": "fetching domain info failed",
+    "dnssec": "fetching DNSSEC info failed",
+}
+
+# "Object does not exist": the zone has no domain in this account
+OBJECT_MISSING_CODES = (2303,)
+
+
+def check(name: str):
+    def register(func):
+        CHECKS[name] = func
+        return func
+    return register
+
+
+def finding(severity: str, message: str, record: dict | None = None, **details) -> dict:
+    result = {"severity": severity, "message": message}
+    if record is not None:
+        result.update(name=record.get("name"), type=record.get("type"), content=record.get("content"))
+    return {**result, **details}
+
+
+def hostname(content) -> str:
+    return str(content or "").rstrip(".").lower()
+
+
+def is_address(value: str) -> bool:
+    try:
+        ipaddress.ip_address(value)
+        return True
+    except ValueError:
+        return False
+
+
+# -----------------------------
+# Checks
+# -----------------------------
+@check("cname-conflict")
+def check_cname_conflict(zone, records, registry, args):
+    """
+    A CNAME must be the only record at its name.
+    """
+    by_name = defaultdict(list)
+    for r in records:
+        by_name[hostname(r.get("name"))].append(r)
+
+    for name, group in by_name.items():
+        cnames = [r for r in group if r.get("type") == "CNAME"]
+        if not cnames:
+            continue
+
+        others = sorted({r.get("type") for r in group if r.get("type") != "CNAME"})
+        if others:
+            yield finding("error", f"CNAME next to {', '.join(others)} records", cnames[0])
+        if len(cnames) > 1:
+            yield finding("error", f"{len(cnames)} CNAME records at one name", cnames[0])
+
+
+@check("dangling-target")
+def check_dangling_target(zone, records, registry, args):
+    """
+    MX and NS targets inside the zone need address records, not CNAMEs.
+    Targets outside the zone are not resolved.
+    """
+    addresses = set()
+    aliases = set()
+    for r in records:
+        if r.get("type") in ("A", "AAAA"):
+            addresses.add(hostname(r.get("name")))
+        elif r.get("type") == "CNAME":
+            aliases.add(hostname(r.get("name")))
+
+    for r in records:
+        if r.get("type") not in ("MX", "NS"):
+            continue
+
+        target = hostname(r.get("content"))
+
+        if is_address(target):
+            yield finding("error", f"{r['type']} target is an IP address, not a hostname", r)
+        elif target in aliases:
+            yield finding("error", f"{r['type']} target {target} is a CNAME", r)
+        elif relative_name(target, zone) != target and target not in addresses:
+            yield finding("error", f"{r['type']} target {target} has no A or AAAA record in the zone", r)
+
+
+@check("ttl-outlier")
+def check_ttl_outlier(zone, records, registry, args):
+    """
+    TTLs more than --ttl-factor times below or above the zone median.
+    """
+    ttls = [int(r["ttl"]) for r in records if r.get("ttl") and r.get("type") not in TTL_IGNORED_TYPES]
+    if len(ttls) < 3:
+        return
+
+    median = statistics.median(ttls)
+    factor = args.ttl_factor
+
+    for r in records:
+        if not r.get("ttl") or r.get("type") in TTL_IGNORED_TYPES:
+            continue
+        ttl = int(r["ttl"])
+        if ttl * factor < median or ttl > median * factor:
+            yield finding("warning", f"TTL {ttl} far from zone median {median:g}", r, ttl=ttl, median=median)
+
+
+@check("ds-delegation")
+def check_ds_delegation(zone, records, registry, args):
+    """
+    DS records belong to delegated subdomains, next to their NS records.
+    """
+    delegated = {
+        hostname(r.get("name")) for r in records
+        if r.get("type") == "NS" and relative_name(r.get("name"), zone) != "@"
+    }
+
+    for r in records:
+        if r.get("type") != "DS":
+            continue
+        if relative_name(r.get("name"), zone) == "@":
+            yield finding("error", "DS record at the zone apex, it belongs in the parent zone", r)
+        elif hostname(r.get("name")) not in delegated:
+            yield finding("error", "DS record without NS delegation", r)
+
+
+@check("registry-ns")
+def check_registry_ns(zone, records, registry, args):
+    """
+    Nameservers at the registry (domain.info) against the zone's apex NS records.
+    Zones of domains not registered with this account are skipped.
+    """
+    domain_info = registry["domain"]
+    if domain_info is None:
+        return
+
+    registry_ns = {hostname(ns) for ns in domain_info.get("ns") or []}
+    zone_ns = {
+        hostname(r.get("content")) for r in records
+        if r.get("type") == "NS" and relative_name(r.get("name"), zone) == "@"
+    }
+
+    if not registry_ns:
+        yield finding("warning", "No nameservers at the registry")
+    elif registry_ns != zone_ns:
+        yield finding(
+            "error", "Registry nameservers differ from the zone's NS records",
+            registry_only=sorted(registry_ns - zone_ns), zone_only=sorted(zone_ns - registry_ns),
+        )
+
+
+@check("dnssec-keys")
+def check_dnssec_keys(zone, records, registry, args):
+    """
+    DNSSEC keys at the registry (dnssec.info) against the zone's apex DNSKEY
+    records. Keys at the registry without DNSKEY records make the zone fail
+    validation; zones signed automatically by INWX (status AUTO) carry no
+    DNSKEY records of their own and are only checked the other way round.
+    """
+    info = registry["dnssec"]
+    if info is None:
+        return
+
+    dnskeys = [
+        r for r in records
+        if r.get("type") == "DNSKEY" and relative_name(r.get("name"), zone) == "@"
+    ]
+    key_count = int(info.get("keyCount") or 0)
+    status = str(info.get("dnssecStatus") or "").upper()
+
+    if key_count and not dnskeys and status != "AUTO":
+        yield finding(
+            "error", f"{key_count} DNSSEC keys at the registry but no DNSKEY records in the zone",
+            key_count=key_count, status=status or None,
+        )
+    elif dnskeys and not key_count:
+        yield finding(
+            "warning", "DNSKEY records in the zone but no DNSSEC keys at the registry",
+            dnskeys=len(dnskeys),
+        )
+
+
+# -----------------------------
+# Fetching
+# -----------------------------
+def fetch_part(api, zone: str, part: str):
+    """
+    One part of a zone's audit data: its records, its registry info or its
+    DNSSEC state at the registry.
+    """
+    if part == "records":
+        result = call_checked(api, "nameserver.info", {"domain": zone})
+        return result.get("resData", {}).get("record") or []
+
+    try:
+        if part == "domain":
+            return call_checked(api, "domain.info", {"domain": zone}).get("resData", {})
+
+        result = call_checked(api, "dnssec.info", {"domains": [zone]}).get("resData", {})
+        return next((d for d in result.get("data") or [] if hostname(d.get("domain")) == zone), None)
+    except INWXAPIError as e:
+        # Zone without a domain in this account (or registered elsewhere),
+        # any other error is reported as a fetch finding
+        if e.result.get("code") in OBJECT_MISSING_CODES:
+            return None
+        raise
+
+
+def iter_zone_data(api, zones, workers: int, limiter: RateLimiter | None = None):
+    """
+    Yield (zone, records, registry, errors) as soon as all calls of a zone
+    are done; errors maps the failed parts to their exception. nameserver.info, domain.info and dnssec.info run side by side
+    on the worker pool; only zones with calls in flight are held in memory.
+    """
+    parts = ((zone, part) for zone in zones for part in PARTS)
+    pending = {}
+
+    for (zone, part), result, error in run_parallel(
+        lambda item: fetch_part(api, *item), parts, workers=workers, limiter=limiter,
+    ):
+        data = pending.setdefault(zone, {})
+        data[part] = (result, error)
+
+        if len(data) < len(PARTS):
+            continue
+
+        del pending[zone]
+        registry = {"domain": data["domain"][0], "dnssec": data["dnssec"][0]}
+        errors = {part: error for part, (_, error) in data.items() if error}
+        yield zone, data["records"][0], registry, errors
+
+
+def audit_zone(zone: str, records, registry, checks, args):
+    for name in checks:
+        try:
+            for result in CHECKS[name](zone, records, registry, args):
+                yield {"zone": zone, "check": name, **result}
+        except Exception as e:
+            yield {"zone": zone, "check": name, "severity": "error", "message": f"check failed: {e}"}
+
+
+# -----------------------------
+# Commands
+# -----------------------------
+def audit(api, api_method, args):
+    checks = args.checks or list(CHECKS)
+    unknown = set(checks) - set(CHECKS)
+
+    if unknown:
+        raise ValueError(f"Unknown checks: {', '.join(sorted(unknown))} (choose from {', '.join(CHECKS)})")
+
+    zones = list_zones(api, args.zones)
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    counts = defaultdict(int)
+
+    try:
+        for zone, records, registry, errors in iter_zone_data(api, zones, args.workers, RateLimiter(args.rate)):
+            findings = [
+                {
+                    "zone": zone, "check": "fetch", "severity": "error",
+                    "message": PARTS[part], "error": getattr(error, "result", None) or str(error),
+                }
+                for part, error in errors.items()
+            ]
+
+            # Without records there is nothing to check, without registry
+            # data the registry checks skip the zone (reported above)
+            if "records" not in errors:
+                findings += audit_zone(zone, records, registry, checks, args)
+
+            for result in findings:
+                counts[result["severity"]] += 1
+                out.write(json.dumps(result, ensure_ascii=False, default=str) + "\n")
+            out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    print(f"Audited {len(zones)} zones: {counts['error']} errors, {counts['warning']} warnings", file=sys.stderr)
+
+    return None
@@ -0,0 +1,138 @@
+# inwx_cli/bulk.py
+
+import json
+import time
+import threading
+from pathlib import Path
+from itertools import islice
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from .api_core import call_checked
+from .tracing import tracer
+
+
+DEFAULT_WORKERS = 4
+DEFAULT_PAGELIMIT = 1000
+
+
+class RateLimiter:
+    """
+    Spaces out calls shared between worker threads.
+    A rate of None or 0 disables limiting.
+    """
+
+    def __init__(self, rate: float | None = None):
+        self.interval = 1.0 / rate if rate else 0.0
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self):
+        if not self.interval:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self.interval
+
+        if delay > 0:
+            time.sleep(delay)
+
+
+class Checkpoint:
+    """
+    Append-only JSONL file of finished work items.
+    Re-running with the same file skips everything already recorded.
+    """
+
+    def __init__(self, path: str | Path | None):
+        self.path = Path(path) if path else None
+        self.entries = {}
+        self._lock = threading.Lock()
+
+        if self.path and self.path.exists():
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    entry = json.loads(line)
+                    self.entries[entry["key"]] = entry.get("value")
+
+    def __contains__(self, key) -> bool:
+        return str(key) in self.entries
+
+    def mark(self, key, value=None):
+        key = str(key)
+
+        with self._lock:
+            self.entries[key] = value
+
+            if not self.path:
+                return
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"key": key, "value": value}, ensure_ascii=False, default=str) + "\n")
+
+
+def run_parallel(func, items, workers: int = DEFAULT_WORKERS, limiter: RateLimiter | None = None):
+    """
+    Run func(item) for every item on a bounded thread pool.
+
+    Yields (item, result, error) tuples in completion order. Items are
+    consumed lazily and only a few per worker are in flight, so results
+    are not held in memory until the caller gets to them.
+    """
+
+    parent = tracer.current()
+    items = iter(items)
+    window = max(1, workers) * 2
+
+    def task(item):
+        if limiter:
+            limiter.wait()
+        with tracer.attach(parent):
+            return func(item)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {}
+
+        while True:
+            for item in islice(items, window - len(futures)):
+                futures[pool.submit(task, item)] = item
+
+            if not futures:
+                return
+
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                item = futures.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    yield item, None, e
+                else:
+                    yield item, result, None
+
+
+def iter_pages(api, api_method, params, key, pagelimit: int = DEFAULT_PAGELIMIT):
+    """
+    Iterate over all entries of a paged list method (e.g. domain.list, nameserver.list).
+    """
+    page = 1
+
+    while True:
+        with tracer.span("page", method=api_method, page=page) as span:
+            result = call_checked(api, api_method, {**params, "page": page, "pagelimit": pagelimit})
+            res_data = result.get("resData", {})
+            entries = res_data.get(key) or []
+            span.set(entries=len(entries))
+
+        yield from entries
+
+        count = res_data.get("count", 0)
+        if not entries or page * pagelimit >= count:
+            return
+
+        page += 1
@@ -3,19 +3,42 @@
 import sys
 import json
 import argparse
+from pathlib import Path
 from .config import (
     config_init,
     config_add,
     config_remove,
     config_set_default,
     config_list,
-    config_doctor,)
+    config_doctor,
+    config_encrypt,)
 from .config import load_config
 from .context import CLIContext
+from .secrets import PROVIDERS as CREDENTIAL_PROVIDERS, DEFAULT_PROVIDER
 from .exceptions import INWXAPIError
+from .tracing import tracer, configure as configure_tracing
 from .api_core import register_methods
-from .api_methods.nameserver import METHODS as NAMESERVER_METHODS
-from .api_methods.domain import METHODS as DOMAIN_METHODS
+from .bulk import DEFAULT_WORKERS
+from .records import records_replace
+from .domains import domain_bulk_info, domain_log, DEFAULT_LOG_POLL_INTERVAL
+from .pricing import pricing_estimate, DEFAULT_MAX_AGE, PRICE_FIELDS
+from .plan import domain_plan, domain_apply, PLAN_METHODS
+from .completion import complete_command, completion_script, completion_refresh
+from .audit import audit, CHECKS as AUDIT_CHECKS, DEFAULT_TTL_FACTOR
+from .zone import zone_clone, zone_diff, zone_export, zone_search, zone_verify, record_write_wait
+from .propagation import DEFAULT_TIMEOUT as DEFAULT_PROPAGATION_TIMEOUT, DNS_PORT
+from .ddns import ddns_watch, DEFAULT_INTERVAL, DEFAULT_IP_URL, DEFAULT_IP6_URL
+from .jobs import (
+    jobs_add,
+    jobs_list,
+    jobs_retry,
+    jobs_run,
+    JOBS_DB,
+    JOB_METHODS,
+    DEFAULT_MAX_ATTEMPTS,
+    DEFAULT_POLL_INTERVAL,
+    DEFAULT_MAX_WAIT,)
+from .api_methods import load_methods, namespaces_for
 
 
 # -----------------------------
@@ -51,6 +74,26 @@ def main():
         help="Select INWX account (overrides default_account in config)"
     )
 
+    parser.add_argument(
+        "--no-cache",
+        dest="no_cache",
+        action="store_true",
+        help="Bypass the response cache for read-only API methods"
+    )
+
+    parser.add_argument(
+        "--trace",
+        metavar="FILE",
+        help="Append spans and events of this run to a JSONL file"
+    )
+
+    parser.add_argument(
+        "--trace-endpoint",
+        dest="trace_endpoint",
+        metavar="URL",
+        help="Send spans to an OTLP/HTTP collector (e.g. http://localhost:4318)"
+    )
+
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     # config subcommand
@@ -65,6 +108,12 @@ def main():
     config_add_parser = config_subparsers.add_parser("add", help="Add new account")
     config_add_parser.set_defaults(func=config_add)
 
+    for account_parser in (config_init_parser, config_add_parser):
+        account_parser.add_argument("--credentials", choices=list(CREDENTIAL_PROVIDERS), default=DEFAULT_PROVIDER,
+                                    help="Where the account's password and shared secret are kept")
+        account_parser.add_argument("--file", help="Credentials file for --credentials file "
+                                                   "(default: ~/.config/inwx/credentials.enc)")
+
     # remove
     config_remove_parser = config_subparsers.add_parser("del", help="Remove account")
     config_remove_parser.add_argument("account", help="Account name")
@@ -75,21 +124,277 @@ def main():
     config_set_default_parser.add_argument("account", help="Account name")
     config_set_default_parser.set_defaults(func=config_set_default)
 
+    # encrypt
+    config_encrypt_parser = config_subparsers.add_parser(
+        "encrypt", help="Store account credentials in the encrypted credentials file"
+    )
+    config_encrypt_parser.add_argument("account", help="Account name")
+    config_encrypt_parser.add_argument("--file", help="Credentials file (default: ~/.config/inwx/credentials.enc)")
+    config_encrypt_parser.set_defaults(func=config_encrypt)
+
     # list
     config_list_parser = config_subparsers.add_parser("list", help="List configured accounts")
     config_list_parser.set_defaults(func=config_list)
 
     # doctor
-    config_doctor_parser = config_subparsers.add_parser("doctor", help="Check config and keyring consistency")
+    config_doctor_parser = config_subparsers.add_parser("doctor", help="Check config and credentials consistency")
+    config_doctor_parser.add_argument("--online", action="store_true", help="Also log in to every account")
+    config_doctor_parser.add_argument("--slow", type=float, default=2.0, help="Seconds after which a call is slow")
+    config_doctor_parser.add_argument("--workers", type=int, default=8, help="Accounts checked in parallel")
     config_doctor_parser.set_defaults(func=config_doctor)
 
-    register_methods(subparsers, NAMESERVER_METHODS)
-    register_methods(subparsers, DOMAIN_METHODS)
+    # records subcommand
+    records_parser = subparsers.add_parser("records", help="Bulk DNS record operations")
+    records_subparsers = records_parser.add_subparsers(dest="records_command", required=True)
+
+    # replace
+    records_replace_parser = records_subparsers.add_parser(
+        "replace", help="Replace record content across zones"
+    )
+    records_replace_parser.add_argument("--from", dest="from_content", metavar="CONTENT", required=True, help="Current record content")
+    records_replace_parser.add_argument("--to", dest="to_content", metavar="CONTENT", required=True, help="New record content")
+    records_replace_parser.add_argument("--type", help="Only records of this type")
+    records_replace_parser.add_argument("--zones", nargs="+", help="Zone glob patterns (default: all zones)")
+    records_replace_parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Parallel API calls")
+    records_replace_parser.add_argument("--rate", type=float, help="Max updates per second")
+    records_replace_parser.add_argument("--checkpoint", help="Checkpoint file to resume an interrupted run")
+    records_replace_parser.add_argument("--dry-run", action="store_true", help="Only print the plan")
+    records_replace_parser.add_argument("--testing", action="store_true", help="Testing mode")
+    records_replace_parser.set_defaults(api_method="nameserver.updateRecord", func=records_replace)
+
+    # zone subcommand
+    zone_parser = subparsers.add_parser("zone", help="Local zone tooling")
+    zone_subparsers = zone_parser.add_subparsers(dest="zone_command", required=True)
+
+    # export
+    zone_export_parser = zone_subparsers.add_parser("export", help="Export records of many zones as JSON lines")
+    zone_export_parser.add_argument("--zones", nargs="+", help="Zone glob patterns (default: all zones)")
+    zone_export_parser.add_argument("--output", "-o", help="Output file (default: stdout)")
+    zone_export_parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Parallel API calls")
+    zone_export_parser.set_defaults(api_method="nameserver.info", func=zone_export)
+
+    # search
+    zone_search_parser = zone_subparsers.add_parser("search", help="Search records across zones")
+    zone_search_parser.add_argument("--name", help="Record name relative to the zone ('@' for the apex)")
+    zone_search_parser.add_argument("--type", help="Record type")
+    zone_search_parser.add_argument("--content", help="Record content")
+    zone_search_parser.add_argument("--zones", nargs="+", help="Zone glob patterns (default: all zones)")
+    zone_search_parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Parallel API calls")
+    zone_search_parser.set_defaults(api_method="nameserver.info", func=zone_search)
+
+    # diff
+    zone_diff_parser = zone_subparsers.add_parser("diff", help="Compare the records of two zones")
+    zone_diff_parser.add_argument("zone", help="Zone name")
+    zone_diff_parser.add_argument("other", help="Zone to compare with")
+    zone_diff_parser.set_defaults(api_method="nameserver.info", func=zone_diff)
+
+    # clone
+    zone_clone_parser = zone_subparsers.add_parser("clone", help="Stamp a template zone onto many domains")
+    zone_clone_parser.add_argument("--source", required=True, help="Template zone")
+    zone_clone_parser.add_argument("--targets", nargs="+", help="Target domains")
+    zone_clone_parser.add_argument("--targets-file", dest="targets_file", help="File with one target domain per line")
+    zone_clone_parser.add_argument("--refresh", action="store_true",
+                                   help="Compare targets again even if they matched the template before")
+    zone_clone_parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Parallel API calls")
+    zone_clone_parser.add_argument("--rate", type=float, help="Max calls per second")
+    zone_clone_parser.add_argument("--testing", action="store_true", help="Testing mode")
+    zone_clone_parser.set_defaults(api_method="nameserver.clone", func=zone_clone)
+
+    # verify
+    zone_verify_parser = zone_subparsers.add_parser(
+        "verify", help="Wait until the authoritative nameservers serve the records"
+    )
+    zone_verify_parser.add_argument("zones", nargs="+", help="Zone names or glob patterns")
+    zone_verify_parser.add_argument("--name", help="Record name relative to the zone ('@' for the apex)")
+    zone_verify_parser.add_argument("--type", help="Record type")
+    zone_verify_parser.add_argument("--timeout", type=float, default=DEFAULT_PROPAGATION_TIMEOUT,
+                                    help="Seconds to wait for propagation")
+    zone_verify_parser.add_argument("--nameservers", nargs="+",
+                                    help="Nameservers to query (default: the zone's NS records)")
+    zone_verify_parser.add_argument("--port", type=int, default=DNS_PORT, help="DNS port")
+    zone_verify_parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Parallel API calls")
+    zone_verify_parser.set_defaults(api_method="nameserver.info", func=zone_verify)
+
+    # domain subcommand
+    domain_parser = subparsers.add_parser("domain", help="Bulk domain operations")
+    domain_subparsers = domain_parser.add_subparsers(dest="domain_command", required=True)
+
+    # bulk-info
+    domain_bulk_info_parser = domain_subparsers.add_parser(
+        "bulk-info", help="Fetch domain.info/domain.whois for many domains into a CSV file"
+    )
+    domain_bulk_info_parser.add_argument("--domain", nargs="+", help="Domain names (default: all domains)")
+    domain_bulk_info_parser.add_argument("--domains-file", dest="domains_file", help="File with one domain per line")
+    domain_bulk_info_parser.add_argument("--whois", action="store_true", help="Fetch domain.whois instead")
+    domain_bulk_info_parser.add_argument("--wide", type=int, help="More detailed domain.info output")
+    domain_bulk_info_parser.add_argument("--output", "-o", required=True, help="CSV output file")
+    domain_bulk_info_parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Parallel API calls")
+    domain_bulk_info_parser.add_argument("--rate", type=float, help="Max calls per second")
+    domain_bulk_info_parser.add_argument("--checkpoint", help="Checkpoint file to resume an interrupted run")
+    domain_bulk_info_parser.set_defaults(api_method="domain.info", func=domain_bulk_info)
+
+    # plan
+    domain_plan_parser = domain_subparsers.add_parser(
+        "plan", help="Validate a bulk domain.create/domain.transfer job into a plan file"
+    )
+    domain_plan_parser.add_argument("--method", required=True, choices=PLAN_METHODS, help="API method")
+    domain_plan_parser.add_argument("--input", required=True,
+                                    help="File with one domain or JSON params object per line")
+    domain_plan_parser.add_argument("--set", nargs="+", metavar="KEY=VALUE", help="Params shared by all items")
+    domain_plan_parser.add_argument("--output", "-o", required=True, help="Plan file")
+    domain_plan_parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Parallel API calls")
+    domain_plan_parser.add_argument("--rate", type=float, help="Max items per second")
+    domain_plan_parser.set_defaults(api_method=None, func=domain_plan)
+
+    # apply
+    domain_apply_parser = domain_subparsers.add_parser("apply", help="Run the valid items of a plan file")
+    domain_apply_parser.add_argument("plan", help="Plan file")
+    domain_apply_parser.add_argument("--skip-invalid", dest="skip_invalid", action="store_true",
+                                     help="Apply valid items even if the plan has invalid ones")
+    domain_apply_parser.add_argument("--checkpoint", help="Checkpoint file (default: next to the plan)")
+    domain_apply_parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Parallel API calls")
+    domain_apply_parser.add_argument("--rate", type=float, help="Max calls per second")
+    domain_apply_parser.set_defaults(api_method=None, func=domain_apply)
+
+    # pricing subcommand
+    pricing_parser = subparsers.add_parser("pricing", help="Local cost estimates")
+    pricing_subparsers = pricing_parser.add_subparsers(dest="pricing_command", required=True)
+
+    # estimate
+    pricing_estimate_parser = pricing_subparsers.add_parser(
+        "estimate", help="Estimate portfolio costs from the cached price table"
+    )
+    pricing_estimate_parser.add_argument("--domain", nargs="+", help="Domain names (default: all domains)")
+    pricing_estimate_parser.add_argument("--domains-file", dest="domains_file", help="File with one domain per line")
+    pricing_estimate_parser.add_argument("--types", nargs="+", choices=list(PRICE_FIELDS), default=["renewal"],
+                                         help="Price types to estimate")
+    pricing_estimate_parser.add_argument("--periods", type=int, nargs="+", default=[1], help="Periods in years")
+    pricing_estimate_parser.add_argument("--max-age", dest="max_age", type=float, default=DEFAULT_MAX_AGE,
+                                         help="Max price table age in seconds")
+    pricing_estimate_parser.add_argument("--refresh", action="store_true", help="Refresh the price table")
+    pricing_estimate_parser.set_defaults(api_method="domain.getPrices", func=pricing_estimate)
+
+    # audit subcommand
+    audit_parser = subparsers.add_parser("audit", help="Check zones and registry data for inconsistencies")
+    audit_parser.add_argument("--zones", nargs="+", help="Zone glob patterns (default: all zones)")
+    audit_parser.add_argument("--checks", nargs="+", choices=list(AUDIT_CHECKS), help="Checks to run (default: all)")
+    audit_parser.add_argument("--ttl-factor", dest="ttl_factor", type=float, default=DEFAULT_TTL_FACTOR,
+                              help="TTLs this many times off the zone median are outliers")
+    audit_parser.add_argument("--output", "-o", help="NDJSON output file (default: stdout)")
+    audit_parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Parallel API calls")
+    audit_parser.add_argument("--rate", type=float, help="Max calls per second")
+    audit_parser.set_defaults(api_method=None, func=audit)
+
+    # ddns subcommand
+    ddns_parser = subparsers.add_parser("ddns", help="Dynamic DNS updater")
+    ddns_subparsers = ddns_parser.add_subparsers(dest="ddns_command", required=True)
+
+    # watch
+    ddns_watch_parser = ddns_subparsers.add_parser("watch", help="Keep records pointed at the public IP")
+    ddns_watch_parser.add_argument("--record-id", dest="record_id", type=int, nargs="+", help="A record ids")
+    ddns_watch_parser.add_argument("--record-id6", dest="record_id6", type=int, nargs="+", help="AAAA record ids")
+    ddns_watch_parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL, help="Poll interval in seconds")
+    ddns_watch_parser.add_argument("--ip-url", dest="ip_url", default=DEFAULT_IP_URL, help="IPv4 lookup URL")
+    ddns_watch_parser.add_argument("--ip6-url", dest="ip6_url", default=DEFAULT_IP6_URL, help="IPv6 lookup URL")
+    ddns_watch_parser.add_argument("--once", action="store_true", help="Check once and exit")
+    ddns_watch_parser.add_argument("--testing", action="store_true", help="Testing mode")
+    ddns_watch_parser.set_defaults(api_method="nameserver.updateRecord", func=ddns_watch)
+
+    # jobs subcommand
+    jobs_parser = subparsers.add_parser("jobs", help="Persistent queue for bulk domain operations")
+    jobs_parser.add_argument("--db", type=Path, default=JOBS_DB, help="Job database file")
+    jobs_subparsers = jobs_parser.add_subparsers(dest="jobs_command", required=True)
+
+    # add
+    jobs_add_parser = jobs_subparsers.add_parser("add", help="Queue jobs")
+    jobs_add_parser.add_argument("--method", required=True, choices=JOB_METHODS, help="API method")
+    jobs_add_parser.add_argument("--input", required=True,
+                                 help="File with one domain or JSON params object per line")
+    jobs_add_parser.add_argument("--set", nargs="+", metavar="KEY=VALUE", help="Params shared by all jobs")
+    jobs_add_parser.set_defaults(func=jobs_add, offline=True)
+
+    # list
+    jobs_list_parser = jobs_subparsers.add_parser("list", help="List jobs")
+    jobs_list_parser.add_argument("--state", help="Filter by state")
+    jobs_list_parser.set_defaults(func=jobs_list, offline=True)
+
+    # retry
+    jobs_retry_parser = jobs_subparsers.add_parser("retry", help="Queue failed jobs again")
+    jobs_retry_parser.add_argument("--id", type=int, nargs="+", help="Job ids (default: all failed)")
+    jobs_retry_parser.set_defaults(func=jobs_retry, offline=True)
+
+    # run
+    jobs_run_parser = jobs_subparsers.add_parser("run", help="Run queued jobs and wait for completion")
+    jobs_run_parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Parallel API calls")
+    jobs_run_parser.add_argument("--rate", type=float, help="Max calls per second")
+    jobs_run_parser.add_argument("--max-attempts", dest="max_attempts", type=int, default=DEFAULT_MAX_ATTEMPTS,
+                                 help="Attempts before a job fails")
+    jobs_run_parser.add_argument("--poll-interval", dest="poll_interval", type=float,
+                                 default=DEFAULT_POLL_INTERVAL, help="Seconds between completion checks")
+    jobs_run_parser.add_argument("--max-wait", dest="max_wait", type=float, default=DEFAULT_MAX_WAIT,
+                                 help="Seconds to wait for submitted jobs before exiting")
+    jobs_run_parser.add_argument("--no-wait", dest="no_wait", action="store_true",
+                                 help="Exit once all jobs are submitted")
+    jobs_run_parser.set_defaults(api_method=None, func=jobs_run)
+
+    # Global options whose values must not be taken for the method name
+    value_options = [o for a in parser._actions if a.nargs != 0 for o in a.option_strings]
+
+    method_parsers = {}
+    for namespace in namespaces_for(sys.argv[1:], value_options):
+        method_parsers.update(register_methods(subparsers, load_methods(namespace)))
+
+    # completion subcommand
+    completion_parser = subparsers.add_parser("completion", help="Shell completion")
+    completion_subparsers = completion_parser.add_subparsers(dest="completion_command", required=True)
+
+    # bash / zsh
+    for shell in ("bash", "zsh"):
+        completion_shell_parser = completion_subparsers.add_parser(shell, help=f"Print the {shell} completion script")
+        completion_shell_parser.set_defaults(func=completion_script, shell=shell, needs_account=False)
+
+    # refresh
+    completion_refresh_parser = completion_subparsers.add_parser(
+        "refresh", help="Refresh the cached domains and record ids used for completion"
+    )
+    completion_refresh_parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Parallel API calls")
+    completion_refresh_parser.set_defaults(api_method=None, func=completion_refresh)
+
+    # domain.log tailing
+    if "domain.log" in method_parsers:
+        domain_log_parser = method_parsers["domain.log"]
+        domain_log_parser.add_argument("--follow", action="store_true",
+                                       help="Keep polling and stream new entries as JSON lines")
+        domain_log_parser.add_argument("--since-cursor", dest="since_cursor", action="store_true",
+                                       help="Only print entries newer than the stored cursor")
+        domain_log_parser.add_argument("--poll-interval", dest="poll_interval", type=float,
+                                       default=DEFAULT_LOG_POLL_INTERVAL, help="Seconds between polls")
+        domain_log_parser.set_defaults(func=domain_log)
+
+    # Waiting for DNS propagation after record writes
+    for method in ("nameserver.createRecord", "nameserver.updateRecord"):
+        if method not in method_parsers:
+            continue
+        record_parser = method_parsers[method]
+        record_parser.add_argument("--wait-propagated", dest="wait_propagated", action="store_true",
+                                   help="Wait until the authoritative nameservers serve the record")
+        record_parser.add_argument("--propagation-timeout", dest="propagation_timeout", type=float,
+                                   default=DEFAULT_PROPAGATION_TIMEOUT, help="Seconds to wait for propagation")
+        record_parser.add_argument("--nameservers", nargs="+",
+                                   help="Nameservers to query (default: the zone's NS records)")
+        record_parser.add_argument("--port", type=int, default=DNS_PORT, help="DNS port")
+        if method == "nameserver.updateRecord":
+            record_parser.add_argument("--zone", help="Zone of the record (needed for --wait-propagated)")
+        record_parser.set_defaults(func=record_write_wait)
+
+    # Called by the completion scripts on every <TAB>
+    if sys.argv[1:2] == ["__complete"]:
+        exit_with(complete_command(config, sys.argv[2:], parser, value_options))
 
     args = parser.parse_args()
 
     # Special case: config commands do not need API login
-    if args.command == "config":
+    if args.command == "config" or not getattr(args, "needs_account", True):
         rc = args.func(args)
         exit_with(rc)
 
@@ -105,22 +410,38 @@ def main():
         print(f"Missing credentials for account '{account}'.", file=sys.stderr)
         exit_with(1)
 
-    ctx = CLIContext(config, account, username)
+    ctx = CLIContext(config, account, username, use_cache=not args.no_cache)
 
     try:
-        with ctx as api:
-            result = args.func(api, args.api_method, args)
+        # Inside the try: an unwritable --trace file is an error like any other
+        configure_tracing(args.trace, args.trace_endpoint)
+
+        with tracer.span("command", command=args.command, api_method=getattr(args, "api_method", None),
+                         account=account):
+            # Local commands only need the account name, no login
+            if getattr(args, "offline", False):
+                result = args.func(account, args)
+            else:
+                with ctx as api:
+                    result = args.func(api, args.api_method, args)
+
+        if result is not None:
             print(get_json(result))
-            rc = 0
+        rc = 0
 
     except INWXAPIError as e:
+        tracer.event("error", code=e.result.get("code"), message=e.result.get("msg"))
         print(get_json(e.result), file=sys.stderr)
         rc = 2
 
     except Exception as e:
+        tracer.event("error", error=f"{type(e).__name__}: {e}")
         print(e, file=sys.stderr)
         rc = 3
 
+    finally:
+        tracer.shutdown()
+
     exit_with(rc)
 
 
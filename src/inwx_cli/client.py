@@ -0,0 +1,161 @@
+# inwx_cli/client.py
+
+import inspect
+import threading
+from .api_core import call_checked
+from .api_methods import NAMESPACES, load_methods
+from .config import load_config
+from .context import CLIContext
+
+
+def method_signature(info: dict) -> inspect.Signature:
+    params = []
+
+    for name, spec in info.get("params", {}).items():
+        convert = spec.get("type")
+        annotation = convert if convert in (str, int, float) else bool
+        if spec.get("nargs"):
+            annotation = list[annotation]
+
+        params.append(inspect.Parameter(
+            name,
+            inspect.Parameter.KEYWORD_ONLY,
+            default=inspect.Parameter.empty if spec.get("required") else None,
+            annotation=annotation,
+        ))
+
+    return inspect.Signature(params, return_annotation=dict)
+
+
+def convert_params(api_method: str, info: dict, kwargs: dict) -> dict:
+    """
+    Validate keyword arguments against a method spec and apply its types.
+    None values are left out, like unset CLI flags.
+    """
+    specs = info.get("params", {})
+    unknown = set(kwargs) - set(specs)
+
+    if unknown:
+        raise TypeError(f"{api_method}() got unexpected arguments: {', '.join(sorted(unknown))}")
+
+    params = {}
+
+    for name, spec in specs.items():
+        value = kwargs.get(name)
+
+        if value is None:
+            if spec.get("required"):
+                raise TypeError(f"{api_method}() missing required argument: '{name}'")
+            continue
+
+        convert = spec.get("type")
+
+        if spec.get("nargs"):
+            values = [value] if isinstance(value, (str, int, float)) else list(value)
+            params[name] = [convert(v) if convert and isinstance(v, str) else v for v in values]
+        else:
+            params[name] = convert(value) if convert and isinstance(value, str) else value
+
+    return params
+
+
+class Namespace:
+    """
+    Methods of one API namespace, e.g. client.domain.info(domain="example.com").
+    """
+
+    def __init__(self, client, namespace: str):
+        self._client = client
+        self._namespace = namespace
+        self._methods = load_methods(namespace)
+
+    def __dir__(self):
+        return [m.partition(".")[2] for m in self._methods]
+
+    def __getattr__(self, name):
+        api_method = f"{self._namespace}.{name}"
+        info = self._methods.get(api_method)
+
+        if info is None:
+            raise AttributeError(f"Unknown API method '{api_method}'")
+
+        def method(**kwargs):
+            return self._client.call(api_method, **convert_params(api_method, info, kwargs))
+
+        method.__name__ = name
+        method.__qualname__ = api_method
+        method.__doc__ = f"{api_method} API call"
+        method.__signature__ = method_signature(info)
+
+        setattr(self, name, method)
+        return method
+
+
+class Client:
+    """
+    Reusable INWX API client for Python code.
+
+    Keeps one logged-in session (and its HTTP connection pool) open until
+    closed and may be shared between threads:
+
+        with Client(account="my-account") as inwx:
+            inwx.domain.info(domain="example.com")
+            inwx.call("nameserver.info", domain="example.com")
+
+    Raises INWXAPIError for API error codes, like the CLI.
+    """
+
+    def __init__(self, account: str | None = None, config: dict | None = None, use_cache: bool = True):
+        config = load_config() if config is None else config
+        account = account or config.get("default_account")
+
+        if not account:
+            raise ValueError("No account specified and no default_account configured.")
+
+        username = config.get(account, {}).get("username") if isinstance(config.get(account), dict) else None
+
+        if not username:
+            raise ValueError(f"Missing credentials for account '{account}'.")
+
+        self.account = account
+        self._ctx = CLIContext(config, account, username, use_cache=use_cache)
+        self._session = None
+        self._lock = threading.Lock()
+        self._namespaces = {}
+
+    def open(self):
+        with self._lock:
+            if self._session is None:
+                self._session = self._ctx.__enter__()
+        return self
+
+    def close(self):
+        with self._lock:
+            if self._session is not None:
+                self._session = None
+                self._ctx.__exit__(None, None, None)
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __getattr__(self, name):
+        if name not in NAMESPACES:
+            raise AttributeError(name)
+
+        namespace = self._namespaces.get(name)
+        if namespace is None:
+            namespace = self._namespaces.setdefault(name, Namespace(self, name))
+        return namespace
+
+    def __dir__(self):
+        return [*super().__dir__(), *NAMESPACES]
+
+    def call(self, api_method: str, **params) -> dict:
+        """
+        Call any API method with the given params (no validation).
+        """
+        session = self._session or self.open()._session
+        return call_checked(session, api_method, params, cached=True)
@@ -0,0 +1,236 @@
+# inwx_cli/completion.py
+
+import sys
+import time
+import argparse
+import subprocess
+from .api_core import kebab
+from .api_methods import NAMESPACES, load_methods
+from .bulk import iter_pages, run_parallel
+from .config import load_cache, write_cache
+from .zone import fetch_zone_records
+
+INDEX_CACHE = "completion"
+INDEX_MAX_AGE = 3600
+REFRESH_TIMEOUT = 600
+
+# Flags completed from the cached index, by index key
+VALUE_FLAGS = {
+    "--domain": "domains",
+    "--domain-name": "domains",
+    "--domains": "domains",
+    "--source-domain": "zones",
+    "--target-domain": "domains",
+    "--ro-id": "ro_ids",
+}
+
+# Flags taking nameserver record ids, by command; --id of other methods
+# (contacts, jobs) is a different kind of id
+RECORD_ID_FLAGS = {
+    "nameserver.deleteRecord": ("--id",),
+    "nameserver.updateRecord": ("--id",),
+    "nameserver.info": ("--record-id",),
+    "ddns": ("--record-id", "--record-id6"),
+}
+
+BASH_SCRIPT = """\
+_inwx_cli() {
+    local IFS=$'\\n'
+    COMPREPLY=($(inwx-cli __complete "$COMP_CWORD" "${COMP_WORDS[@]}" 2>/dev/null))
+}
+complete -o default -F _inwx_cli inwx-cli
+"""
+
+ZSH_SCRIPT = """\
+autoload -U +X bashcompinit && bashcompinit
+""" + BASH_SCRIPT
+
+
+def build_index(api, workers: int) -> dict:
+    zones = {}
+    for entry in iter_pages(api, "nameserver.list", {}, "domains"):
+        zones[entry["domain"]] = entry.get("roId")
+
+    domains = [entry["domain"] for entry in iter_pages(api, "domain.list", {}, "domain")]
+
+    record_ids = []
+    for zone, records, error in run_parallel(lambda z: fetch_zone_records(api, z), list(zones), workers=workers):
+        if not error:
+            record_ids.extend(str(r["id"]) for r in records)
+
+    return {
+        "updated": time.time(),
+        "domains": sorted(set(domains) | set(zones)),
+        "zones": sorted(zones),
+        "ro_ids": sorted(str(ro_id) for ro_id in zones.values() if ro_id is not None),
+        "record_ids": record_ids,
+    }
+
+
+def refresh_in_background(account: str):
+    """
+    Start 'completion refresh' detached, so completion never waits for the API.
+    """
+    subprocess.Popen(
+        [sys.executable, "-m", "inwx_cli.cli", "--account", account, "completion", "refresh"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def account_from_words(words, config: dict) -> str | None:
+    for i, word in enumerate(words):
+        if word == "--account" and i + 1 < len(words):
+            return words[i + 1]
+    return config.get("default_account")
+
+
+def command_from_words(words, value_options=("--account",)) -> str | None:
+    """
+    First word that is neither a global option nor the value of one.
+    """
+    skip = False
+    for word in words[1:]:
+        if skip:
+            skip = False
+            continue
+        if word in value_options:
+            skip = True
+            continue
+        if not word.startswith("-"):
+            return word
+    return None
+
+
+def subparser_choices(parser: argparse.ArgumentParser) -> dict:
+    for action in parser._actions:
+        if isinstance(action, argparse._SubParsersAction):
+            return action.choices
+    return {}
+
+
+def walk_parser(parser: argparse.ArgumentParser, words):
+    """
+    Innermost subparser selected by words, and the option still waiting
+    for its value (None if the last word does not take one).
+    """
+    pending = None
+
+    for word in words:
+        if pending is not None:
+            pending = None
+            continue
+
+        if word.startswith("-"):
+            action = parser._option_string_actions.get(word)
+            if action is not None and action.nargs != 0:
+                pending = action
+            continue
+
+        parser = subparser_choices(parser).get(word, parser)
+
+    return parser, pending
+
+
+def index_values(config: dict, account: str | None, key: str) -> list[str]:
+    if not account:
+        return []
+
+    cache = load_cache(INDEX_CACHE)
+    index = cache.setdefault(account, {})
+    now = time.time()
+
+    stale = now - index.get("updated", 0) > INDEX_MAX_AGE
+    refreshing = now - index.get("refresh_started", 0) < REFRESH_TIMEOUT
+
+    if stale and not refreshing and account in config:
+        index["refresh_started"] = now
+        write_cache(INDEX_CACHE, cache)
+        try:
+            refresh_in_background(account)
+        except OSError:
+            pass
+
+    return index.get(key, [])
+
+
+def option_strings(parser: argparse.ArgumentParser) -> list[str]:
+    return [o for o in parser._option_string_actions if o.startswith("--")]
+
+
+def candidates(words, cword: int, config: dict, parser: argparse.ArgumentParser,
+               value_options=("--account",)) -> list[str]:
+    current = words[cword] if cword < len(words) else ""
+    previous = words[cword - 1] if cword > 0 else ""
+    command = command_from_words(words[:cword], value_options)
+
+    if previous == "--account":
+        return [k for k, v in config.items() if isinstance(v, dict)]
+
+    if command is None:
+        if current.startswith("-"):
+            return option_strings(parser)
+        commands = [c for c in subparser_choices(parser) if "." not in c]
+        namespace = current.partition(".")[0]
+        namespaces = (namespace,) if "." in current and namespace in NAMESPACES else NAMESPACES
+        return [*commands, *(m for ns in namespaces for m in load_methods(ns))]
+
+    if previous in RECORD_ID_FLAGS.get(command, ()):
+        return index_values(config, account_from_words(words, config), "record_ids")
+
+    if previous in VALUE_FLAGS:
+        return index_values(config, account_from_words(words, config), VALUE_FLAGS[previous])
+
+    namespace = command.partition(".")[0]
+    if namespace in NAMESPACES:
+        if not current.startswith("-"):
+            return []
+        info = load_methods(namespace).get(command, {})
+        return ["--" + kebab(p) for p in info.get("params", {})]
+
+    # Commands that are not API methods: walk their subparsers
+    subparser, pending = walk_parser(parser, words[1:cword])
+
+    if pending is not None:
+        return [str(c) for c in pending.choices or ()]
+    if current.startswith("-"):
+        return option_strings(subparser)
+    return list(subparser_choices(subparser))
+
+
+def complete_command(config: dict, argv, parser: argparse.ArgumentParser, value_options=("--account",)) -> int:
+    """
+    Entry point of the shell scripts: __complete CWORD WORDS...
+    Prints one candidate per line, without logging in. value_options are
+    the global options that take a value.
+    """
+    try:
+        cword = int(argv[0])
+    except (IndexError, ValueError):
+        return 1
+
+    words = argv[1:]
+    current = words[cword] if cword < len(words) else ""
+
+    for candidate in candidates(words, cword, config, parser, value_options):
+        if candidate.startswith(current):
+            print(candidate)
+
+    return 0
+
+
+# -----------------------------
+# Commands
+# -----------------------------
+def completion_script(args):
+    print(BASH_SCRIPT if args.shell == "bash" else ZSH_SCRIPT, end="")
+
+
+def completion_refresh(api, api_method, args):
+    cache = load_cache(INDEX_CACHE)
+    cache[api.account] = build_index(api, args.workers)
+    write_cache(INDEX_CACHE, cache)
+
+    return None
@@ -3,13 +3,24 @@
 import os
 import sys
 import stat
+import json
+import time
 import getpass
 import tomllib
 from pathlib import Path
-from .secrets import SecretStore
-
-CONFIG_DIR = Path.home() / ".config" / "inwx"
-CONFIG_FILE = CONFIG_DIR / "config.toml"
+from .secrets import (
+    PASSWORD_ENV,
+    SHARED_SECRET_ENV,
+    SecretStore,
+    credential_provider_for,
+    read_credentials_file,
+    read_passphrase,
+    write_credentials_file,
+)
+from .api_core import call_checked
+from .bulk import run_parallel
+from .context import CLIContext
+from .paths import CACHE_DIR, CONFIG_DIR, CONFIG_FILE, CREDENTIALS_FILE
 
 
 # -----------------------------
@@ -51,6 +62,29 @@ def write_config(content: str):
     os.chmod(CONFIG_FILE, 0o600)
 
 
+def load_cache(name: str) -> dict:
+    path = CACHE_DIR / f"{name}.json"
+
+    if not path.exists():
+        return {}
+
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_cache(name: str, data: dict):
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+    path = CACHE_DIR / f"{name}.json"
+    tmp = path.with_suffix(".tmp")
+
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, default=str)
+
+    os.chmod(tmp, 0o600)
+    os.replace(tmp, path)
+
+
 def serialize_config(config: dict) -> str:
     lines = []
 
@@ -68,6 +102,70 @@ def serialize_config(config: dict) -> str:
     return "\n".join(lines) + "\n"
 
 
+def probe_account(config: dict, account: str) -> dict:
+    """
+    Log in to one account and time login and an account.info round trip.
+    """
+    ctx = CLIContext(config, account, config[account].get("username"))
+    timings = {}
+
+    start = time.monotonic()
+    with ctx as api:
+        timings["login"] = time.monotonic() - start
+
+        start = time.monotonic()
+        call_checked(api, "account.info")
+        timings["account.info"] = time.monotonic() - start
+
+    return timings
+
+
+def prompt_secrets() -> tuple[str, str]:
+    password = getpass.getpass("Password: ")
+    secret = getpass.getpass("Shared Secret (optional): ")
+    return password, secret
+
+
+def write_account_credentials(account: str, path, password: str, secret: str) -> Path:
+    """
+    Add or replace the credentials of an account in the encrypted credentials file.
+    """
+    path = Path(path or CREDENTIALS_FILE).expanduser()
+    passphrase = read_passphrase(confirm=not path.exists())
+    credentials = read_credentials_file(path, passphrase) if path.exists() else {}
+
+    credentials[account] = {"password": password, "shared_secret": secret or None}
+    write_credentials_file(path, passphrase, credentials)
+    return path
+
+
+def store_credentials(account: str, args) -> dict:
+    """
+    Store the secrets of a new account with the provider chosen by
+    --credentials. Returns the provider settings of its config entry.
+    """
+    if args.credentials == "env":
+        print(f"Password and shared secret are read from ${PASSWORD_ENV} and ${SHARED_SECRET_ENV}.")
+        return {"credentials": "env"}
+
+    if args.credentials == "stdin":
+        return {"credentials": "stdin"}
+
+    password, secret = prompt_secrets()
+
+    if args.credentials == "file":
+        path = write_account_credentials(account, args.file, password, secret)
+        print(f"Credentials written to {path}")
+        return {"credentials": "file", **({"credentials_file": str(path)} if args.file else {})}
+
+    SecretStore.set_password(account, password)
+
+    if secret:
+        SecretStore.set_shared_secret(account, secret)
+
+    return {}
+
+
 # -----------------------------
 # Commands
 # -----------------------------
@@ -80,21 +178,15 @@ def config_init(args):
 
     account = input("Account name: ").strip()
     username = input("Username: ").strip()
-    password = getpass.getpass("Password: ")
-    secret = getpass.getpass("Shared Secret (optional): ")
 
     config = {
         "default_account": account,
         account: {
             "username": username,
+            **store_credentials(account, args),
         }
     }
 
-    SecretStore.set_password(account, password)
-
-    if secret:
-        SecretStore.set_shared_secret(account, secret)
-
     write_config(serialize_config(config))
 
     print(f"\nConfig written to {CONFIG_FILE}")
@@ -113,18 +205,12 @@ def config_add(args):
         return
 
     username = input("Username: ").strip()
-    password = getpass.getpass("Password: ")
-    secret = getpass.getpass("Shared Secret (optional): ")
 
     config[account] = {
         "username": username,
+        **store_credentials(account, args),
     }
 
-    SecretStore.set_password(account, password)
-
-    if secret:
-        SecretStore.set_shared_secret(account, secret)
-
     write_config(serialize_config(config))
 
     print(f"\nAccount '{account}' added successfully.")
@@ -149,8 +235,14 @@ def config_remove(args):
         print("Aborted.")
         return
 
-    SecretStore.del_password(account)
-    SecretStore.del_shared_secret(account)
+    try:
+        if credential_provider_for(account, config[account]).name == "keyring":
+            SecretStore.del_password(account)
+            SecretStore.del_shared_secret(account)
+    except (ValueError, RuntimeError) as e:
+        # A broken credentials setting must not keep the account around
+        print(f"WARNING: credentials not removed: {e}", file=sys.stderr)
+
     del config[account]
 
     if config.get("default_account") == account:
@@ -162,6 +254,25 @@ def config_remove(args):
     print(f"Account '{account}' removed.")
 
 
+def config_encrypt(args):
+    """
+    Store the credentials of an account in the encrypted credentials file.
+    """
+    config = load_config()
+    account = args.account
+
+    if account not in config or not isinstance(config.get(account), dict):
+        print(f"Account '{account}' does not exist.")
+        return 1
+
+    path = args.file or config[account].get("credentials_file") or CREDENTIALS_FILE
+    password, secret = prompt_secrets()
+    path = write_account_credentials(account, path, password, secret)
+
+    print(f"\nCredentials of '{account}' written to {path}")
+    print(f"Set credentials = \"file\" for [{account}] in {CONFIG_FILE} to use them.")
+
+
 def config_set_default(args):
     config = load_config()
 
@@ -203,11 +314,25 @@ def config_list(args):
         username = value.get("username")
         print(f"  username: {username or 'missing ✘'} ✔")
 
-        has_password = bool(SecretStore.get_password(account))
-        has_secret = bool(SecretStore.get_shared_secret(account))
+        try:
+            provider = credential_provider_for(account, value)
+        except ValueError as e:
+            print(f"  credentials: {e} ✘\n")
+            continue
+
+        print(f"  credentials: {provider.name}")
 
-        print(f"  password: {'stored in keyring ✔' if has_password else 'not set ✘'}")
-        print(f"  shared_secret: {'stored in keyring ✔' if has_secret else 'not set ✘'}")
+        # stdin can only be read once, by the command that needs it
+        if provider.name != "stdin":
+            try:
+                has_password = bool(provider.get_password())
+                has_secret = bool(provider.get_shared_secret())
+            except (OSError, RuntimeError) as e:
+                print(f"  password: {e} ✘\n")
+                continue
+
+            print(f"  password: {'stored ✔' if has_password else 'not set ✘'}")
+            print(f"  shared_secret: {'stored ✔' if has_secret else 'not set ✘'}")
         print()
 
 def config_doctor(args):
@@ -258,18 +383,36 @@ def config_doctor(args):
             print("  username: missing ✘")
             errors += 1
 
-        pwd = SecretStore.get_password(account)
+        try:
+            provider = credential_provider_for(account, entry)
+        except ValueError as e:
+            print(f"  credentials: {e} ✘\n")
+            errors += 1
+            continue
+
+        if provider.name == "stdin":
+            print("  credentials (stdin): read at login")
+            print()
+            continue
+
+        try:
+            pwd = provider.get_password()
+            secret = provider.get_shared_secret()
+        except (OSError, RuntimeError) as e:
+            print(f"  credentials ({provider.name}): {e} ✘\n")
+            errors += 1
+            continue
+
         if pwd:
-            print("  password (keyring): ✔")
+            print(f"  password ({provider.name}): ✔")
         else:
-            print("  password (keyring): missing ✘")
+            print(f"  password ({provider.name}): missing ✘")
             errors += 1
 
-        secret = SecretStore.get_shared_secret(account)
         if secret:
-            print("  shared_secret (keyring): ✔")
+            print(f"  shared_secret ({provider.name}): ✔")
         else:
-            print("  shared_secret (keyring): not set ✘")
+            print(f"  shared_secret ({provider.name}): not set ✘")
             warnings += 1
 
         print()
@@ -291,6 +434,37 @@ def config_doctor(args):
 
     print()
 
+    # -----------------------------
+    # Online checks
+    # -----------------------------
+    if getattr(args, "online", False):
+        print("Online:")
+
+        probes = {}
+        for account, timings, error in run_parallel(
+            lambda a: probe_account(config, a), accounts, workers=args.workers
+        ):
+            probes[account] = (timings, error)
+
+        for account in accounts:
+            timings, error = probes[account]
+            print(f"- {account}")
+
+            if error:
+                print(f"  connection: failed ✘ ({error})")
+                errors += 1
+                print()
+                continue
+
+            for step, seconds in timings.items():
+                if seconds > args.slow:
+                    print(f"  {step}: {seconds:.2f}s slow ✘")
+                    warnings += 1
+                else:
+                    print(f"  {step}: {seconds:.2f}s ✔")
+
+            print()
+
     # -----------------------------
     # Summary
     # -----------------------------
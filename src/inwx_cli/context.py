@@ -1,6 +1,10 @@
 # inwx_cli/context.py
 
 from .api_session import INWXSession
+from .response_cache import response_cache_for
+from .secrets import credential_provider_for
+
+API_URL = "https://api.domrobot.com"
 
 
 class CLIContext:
@@ -9,18 +13,22 @@ class CLIContext:
     Holds config, account and API session.
     """
 
-    def __init__(self, config, account, username):
+    def __init__(self, config, account, username, use_cache=True):
         self.config = config
         self.account = account
         self.username = username
+        self.use_cache = use_cache
         self.session = None
 
     def __enter__(self):
         self.session = INWXSession(
-            api_url="https://api.domrobot.com",
+            api_url=API_URL,
             account=self.account,
             username=self.username,
         )
+        self.session.credentials = credential_provider_for(self.account, self.config.get(self.account, {}))
+        if self.use_cache:
+            self.session.cache = response_cache_for(self.config.get(self.account, {}))
         return self.session.__enter__()
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -0,0 +1,112 @@
+# inwx_cli/ddns.py
+
+import sys
+import json
+import time
+import ipaddress
+import urllib.request
+from .api_core import call_checked
+from .config import load_cache, write_cache
+
+CACHE_NAME = "ddns"
+DEFAULT_INTERVAL = 60
+DEFAULT_IP_URL = "https://api.ipify.org"
+DEFAULT_IP6_URL = "https://api6.ipify.org"
+
+
+def get_public_ip(url: str, version: int, timeout: float = 10) -> str:
+    """
+    Public address from a lookup URL, which must answer with a plain
+    IPv4 or IPv6 address (as requested by version).
+    """
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        text = response.read(64).decode("ascii", "replace").strip()
+
+    try:
+        address = ipaddress.ip_address(text)
+    except ValueError:
+        raise ValueError(f"not an IP address: {text[:40]!r}") from None
+
+    if address.version != version:
+        raise ValueError(f"expected an IPv{version} address, got {address}")
+
+    return str(address)
+
+
+def emit(entry: dict):
+    print(json.dumps(entry, ensure_ascii=False, default=str), flush=True)
+
+
+def sync_records(api, api_method, record_ids, address, pushed: dict, testing=False) -> bool:
+    """
+    Update every record whose last pushed value differs from address.
+    Returns True if the pushed cache changed.
+    """
+    changed = False
+
+    for record_id in record_ids:
+        key = str(record_id)
+        if pushed.get(key) == address:
+            continue
+
+        params = {"id": record_id, "content": address}
+        if testing:
+            params["testing"] = True
+
+        try:
+            call_checked(api, api_method, params)
+        except Exception as e:
+            print(f"Record {record_id}: update failed: {e}", file=sys.stderr)
+            continue
+
+        emit({"time": time.time(), "id": record_id, "content": address, "previous": pushed.get(key)})
+
+        # Testing mode changes nothing, the real watcher still has to push
+        if not testing:
+            pushed[key] = address
+            changed = True
+
+    return changed
+
+
+def ddns_watch(api, api_method, args):
+    if not args.record_id and not args.record_id6:
+        raise ValueError("Specify at least one --record-id or --record-id6")
+
+    account = getattr(api, "account", None) or "default"
+    cache = load_cache(CACHE_NAME)
+    pushed = cache.setdefault(account, {})
+
+    families = [
+        (args.record_id, args.ip_url, 4),
+        (args.record_id6, args.ip6_url, 6),
+    ]
+
+    try:
+        while True:
+            changed = False
+
+            for record_ids, url, version in families:
+                if not record_ids:
+                    continue
+
+                try:
+                    address = get_public_ip(url, version)
+                except (OSError, ValueError) as e:
+                    print(f"Could not determine public IP from {url}: {e}", file=sys.stderr)
+                    continue
+
+                changed |= sync_records(api, api_method, record_ids, address, pushed, args.testing)
+
+            if changed:
+                write_cache(CACHE_NAME, cache)
+
+            if args.once:
+                break
+
+            time.sleep(args.interval)
+
+    except KeyboardInterrupt:
+        pass
+
+    return None
@@ -0,0 +1,223 @@
+# inwx_cli/domains.py
+
+import csv
+import json
+import time
+import hashlib
+from datetime import datetime
+from .api_core import call_checked, extract_api_params, handle_generic
+from .bulk import Checkpoint, RateLimiter, iter_pages, run_parallel
+from .config import load_cache, write_cache
+
+LOG_CURSOR_CACHE = "log_cursor"
+DEFAULT_LOG_POLL_INTERVAL = 60
+
+# Options added to the domain.log parser, not API parameters
+LOG_FOLLOW_ARGS = {"follow", "since_cursor", "poll_interval"}
+
+
+def read_domain_file(path) -> list[str]:
+    with open(path, encoding="utf-8") as f:
+        return [
+            line.strip() for line in f
+            if line.strip() and not line.lstrip().startswith("#")
+        ]
+
+
+def domain_suffixes(domain: str) -> list[str]:
+    """
+    Candidate TLDs of a domain, longest first: 'a.co.uk' -> ['co.uk', 'uk'].
+    """
+    labels = domain.lower().rstrip(".").split(".")
+    return [".".join(labels[i:]) for i in range(1, len(labels))]
+
+
+def tld_of(domain: str, known_tlds) -> str | None:
+    """
+    Longest known suffix of domain (e.g. 'co.uk' before 'uk').
+    """
+    for suffix in domain_suffixes(domain):
+        if suffix in known_tlds:
+            return suffix
+
+    return None
+
+
+def list_domains(api) -> list[str]:
+    return [entry["domain"] for entry in iter_pages(api, "domain.list", {}, "domain")]
+
+
+def resolve_domains(api, args) -> list[str]:
+    """
+    Domains from --domain / --domains-file, or every domain of the account.
+    """
+    domains = list(args.domain or [])
+
+    if args.domains_file:
+        domains += read_domain_file(args.domains_file)
+
+    if not domains:
+        domains = list_domains(api)
+
+    # keep order, drop duplicates
+    return list(dict.fromkeys(domains))
+
+
+def flatten(data, prefix: str = "") -> dict:
+    """
+    Flatten nested API results into dotted column names.
+    Lists of scalars are joined with ';', anything else is JSON encoded.
+    """
+    row = {}
+
+    for key, value in data.items():
+        name = f"{prefix}{key}"
+
+        if isinstance(value, dict):
+            row.update(flatten(value, f"{name}."))
+        elif isinstance(value, list):
+            if all(not isinstance(v, (dict, list)) for v in value):
+                row[name] = ";".join(str(v) for v in value)
+            else:
+                row[name] = json.dumps(value, ensure_ascii=False, default=str)
+        else:
+            row[name] = value
+
+    return row
+
+
+def write_csv(path, rows: list[dict]):
+    columns = {}
+    for row in rows:
+        columns.update(dict.fromkeys(row))
+
+    fieldnames = ["domain"] + sorted(c for c in columns if c != "domain")
+
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def domain_bulk_info(api, api_method, args):
+    if args.whois:
+        api_method = "domain.whois"
+
+    domains = resolve_domains(api, args)
+    checkpoint = Checkpoint(args.checkpoint)
+    pending = [d for d in domains if d not in checkpoint]
+    limiter = RateLimiter(args.rate)
+
+    def fetch(domain):
+        params = {"domain": domain}
+        if api_method == "domain.info" and args.wide is not None:
+            params["wide"] = args.wide
+
+        result = call_checked(api, api_method, params)
+        return {"domain": domain, **flatten(result.get("resData", {}))}
+
+    failed = []
+
+    for domain, row, error in run_parallel(fetch, pending, workers=args.workers, limiter=limiter):
+        if error:
+            failed.append({"domain": domain, "error": getattr(error, "result", None) or str(error)})
+            continue
+
+        checkpoint.mark(domain, row)
+
+    rows = [checkpoint.entries[d] for d in domains if d in checkpoint]
+    write_csv(args.output, rows)
+
+    return {
+        "domains": len(domains),
+        "fetched": len(pending) - len(failed),
+        "resumed": len(domains) - len(pending),
+        "failed": failed,
+        "output": args.output,
+    }
+
+
+def entry_hash(entry: dict) -> str:
+    return hashlib.sha1(json.dumps(entry, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def cursor_key(account: str, filters: dict) -> str:
+    if not filters:
+        return account
+    return f"{account}:{json.dumps(filters, sort_keys=True, default=str)}"
+
+
+def log_date(entry: dict) -> str:
+    """
+    Entry date as sortable 'YYYY-MM-DD HH:MM:SS', whether the API returned
+    a string or a date object.
+    """
+    value = entry.get("date")
+
+    if hasattr(value, "timetuple"):
+        return datetime(*value.timetuple()[:6]).isoformat(sep=" ")
+    return str(value or "")
+
+
+def fetch_new_log_entries(api, filters: dict, cursor: dict) -> list[dict]:
+    """
+    domain.log entries newer than cursor, oldest first.
+
+    The cursor holds the date of the newest entry seen and the hashes of all
+    entries with that date, so only pages from that date on are fetched.
+    """
+    params = dict(filters)
+    if cursor.get("date"):
+        # The JSON-RPC transport only sends plain strings
+        params["dateFrom"] = cursor["date"]
+
+    seen = set(cursor.get("seen", []))
+    entries = [
+        e for e in iter_pages(api, "domain.log", params, "domain")
+        if log_date(e) >= cursor.get("date", "") and entry_hash(e) not in seen
+    ]
+    entries.sort(key=log_date)
+
+    if entries:
+        newest = log_date(entries[-1])
+        if newest != cursor.get("date"):
+            seen = set()
+        seen.update(entry_hash(e) for e in entries if log_date(e) == newest)
+        cursor["date"] = newest
+        cursor["seen"] = sorted(seen)
+
+    return entries
+
+
+def domain_log(api, api_method, args):
+    if not args.follow and not args.since_cursor:
+        return handle_generic(api, api_method, args, LOG_FOLLOW_ARGS)
+
+    filters = {
+        k: v for k, v in extract_api_params(args, LOG_FOLLOW_ARGS).items()
+        if k not in ("page", "pagelimit", "dateFrom")
+    }
+    key = cursor_key(getattr(api, "account", None) or "default", filters)
+
+    try:
+        while True:
+            cache = load_cache(LOG_CURSOR_CACHE)
+            cursor = cache.get(key, {})
+
+            entries = fetch_new_log_entries(api, filters, cursor)
+            for entry in entries:
+                print(json.dumps(entry, ensure_ascii=False, default=str), flush=True)
+
+            if entries:
+                cache[key] = cursor
+                write_cache(LOG_CURSOR_CACHE, cache)
+
+            if not args.follow:
+                break
+
+            time.sleep(args.poll_interval)
+
+    except KeyboardInterrupt:
+        pass
+
+    return None
@@ -0,0 +1,393 @@
+# inwx_cli/jobs.py
+
+import sys
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from datetime import datetime
+from .api_core import call_checked
+from .bulk import RateLimiter, run_parallel
+from .paths import DATA_DIR
+from .exceptions import INWXAPIError
+from .tracing import tracer
+
+JOBS_DB = DATA_DIR / "jobs.sqlite"
+
+JOB_METHODS = (
+    "domain.create",
+    "domain.delete",
+    "domain.renew",
+    "domain.restore",
+    "domain.trade",
+    "domain.transfer",
+)
+
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_POLL_INTERVAL = 60
+DEFAULT_MAX_WAIT = 6 * 3600
+
+# Operation of a job method as named in domain.log entries
+LOG_OPERATIONS = {
+    "domain.create": "CREATE",
+    "domain.delete": "DELETE",
+    "domain.renew": "RENEW",
+    "domain.restore": "RESTORE",
+    "domain.trade": "TRADE",
+    "domain.transfer": "TRANSFER",
+}
+
+# domain.log status values that finish a submitted job
+DONE_STATUSES = {"SUCCESSFUL", "SUCCESS", "OK"}
+FAILED_STATUSES = {"FAILED", "ERROR", "CANCELLED", "REJECTED"}
+
+# Job states:
+#   pending    waiting to be sent
+#   sending    API call in flight (left behind by a crash)
+#   unknown    call may or may not have reached the API
+#   submitted  accepted by the API, waiting for completion
+#   done       finished successfully
+#   failed     rejected by the API, or out of attempts and verified as not sent
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    account TEXT NOT NULL,
+    method TEXT NOT NULL,
+    params TEXT NOT NULL,
+    idempotency_key TEXT NOT NULL UNIQUE,
+    state TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    result TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    sent_at REAL,
+    next_run REAL NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS jobs_state ON jobs (account, state);
+"""
+
+
+def idempotency_key(account: str, method: str, params: dict) -> str:
+    canonical = json.dumps([account, method, params], sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class JobQueue:
+    """
+    SQLite backed job queue, shared between worker threads.
+    """
+
+    def __init__(self, path=JOBS_DB):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self):
+        self.db.close()
+
+    def add(self, account: str, method: str, params: dict) -> bool:
+        """
+        Queue a job. Returns False if the same job is already queued.
+        """
+        now = time.time()
+        with self._lock:
+            cursor = self.db.execute(
+                "INSERT OR IGNORE INTO jobs (account, method, params, idempotency_key, created_at, updated_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (account, method, json.dumps(params, sort_keys=True, default=str),
+                 idempotency_key(account, method, params), now, now),
+            )
+        return cursor.rowcount == 1
+
+    def update(self, job_id: int, **fields):
+        fields["updated_at"] = time.time()
+        columns = ", ".join(f"{k} = ?" for k in fields)
+
+        with self._lock:
+            self.db.execute(f"UPDATE jobs SET {columns} WHERE id = ?", (*fields.values(), job_id))
+
+    def select(self, account: str, states, due_only: bool = False) -> list[sqlite3.Row]:
+        query = f"SELECT * FROM jobs WHERE account = ? AND state IN ({', '.join('?' * len(states))})"
+        values = [account, *states]
+
+        if due_only:
+            query += " AND next_run <= ?"
+            values.append(time.time())
+
+        with self._lock:
+            return self.db.execute(query + " ORDER BY id", values).fetchall()
+
+    def list(self, account: str, state: str | None = None) -> list[dict]:
+        query = "SELECT * FROM jobs WHERE account = ?"
+        values = [account]
+
+        if state:
+            query += " AND state = ?"
+            values.append(state)
+
+        with self._lock:
+            rows = self.db.execute(query + " ORDER BY id", values).fetchall()
+
+        return [row_to_dict(row) for row in rows]
+
+
+def row_to_dict(row) -> dict:
+    job = dict(row)
+    job["params"] = json.loads(job["params"])
+    if job["result"]:
+        job["result"] = json.loads(job["result"])
+    return job
+
+
+def log_entries_since(api, domain: str, since: float) -> list[dict]:
+    result = call_checked(api, "domain.log", {
+        "domain": domain,
+        # The JSON-RPC transport only sends plain strings
+        "dateFrom": datetime.fromtimestamp(since).strftime("%Y-%m-%d %H:%M:%S"),
+    })
+    return result.get("resData", {}).get("domain") or []
+
+
+def job_cltrid(job) -> str:
+    return job["idempotency_key"][:32]
+
+
+def entry_matches(job, entry: dict) -> bool:
+    """
+    Whether a domain.log entry belongs to the job: by clTRID where the entry
+    has one, otherwise by operation type.
+    """
+    if entry.get("clTRID"):
+        return entry["clTRID"] == job_cltrid(job)
+
+    operation = str(entry.get("type") or entry.get("operation") or "").upper()
+    if operation:
+        return LOG_OPERATIONS[job["method"]] in operation
+
+    # Entries without either field only tell us something happened
+    return True
+
+
+def job_log_entries(api, job) -> list[dict]:
+    params = json.loads(job["params"])
+    entries = log_entries_since(api, params["domain"], job["sent_at"] or job["created_at"])
+    return [e for e in entries if entry_matches(job, e)]
+
+
+def was_sent(api, job) -> bool:
+    """
+    Check domain.log for the job's operation on its domain since it was sent.
+    """
+    return bool(job_log_entries(api, job))
+
+
+def completion_state(api, job) -> str | None:
+    """
+    'done' or 'failed' once domain.log reports the outcome, otherwise None.
+    """
+    params = json.loads(job["params"])
+    statuses = {str(e.get("status", "")).upper() for e in job_log_entries(api, job)}
+
+    if statuses & FAILED_STATUSES:
+        return "failed"
+    if statuses & DONE_STATUSES:
+        return "done"
+
+    # domain.info is authoritative for create/transfer once the domain is active
+    if job["method"] in ("domain.create", "domain.transfer"):
+        info = call_checked(api, "domain.info", {"domain": params["domain"]})
+        if str(info.get("resData", {}).get("status", "")).upper() == "OK":
+            return "done"
+
+    return None
+
+
+def execute(api, queue: JobQueue, job, max_attempts: int):
+    params = json.loads(job["params"])
+    # clTRID lets INWX support trace the call back to the job
+    params["clTRID"] = job_cltrid(job)
+    attempts = job["attempts"] + 1
+
+    if attempts > 1:
+        tracer.event("retry", job=job["id"], method=job["method"], attempt=attempts)
+
+    queue.update(job["id"], state="sending", attempts=attempts, sent_at=time.time())
+
+    try:
+        result = call_checked(api, job["method"], params)
+
+    except INWXAPIError as e:
+        queue.update(job["id"], state="failed", result=json.dumps(e.result, default=str))
+        return "failed"
+
+    except Exception as e:
+        # The request may have reached the API, recover() checks domain.log
+        # before it is sent again or given up
+        queue.update(job["id"], state="unknown", result=json.dumps(str(e)), next_run=time.time() + 2 ** attempts)
+        return "unknown"
+
+    # 1001: accepted, action pending
+    state = "submitted" if result.get("code") == 1001 or "scDate" in params else "done"
+    queue.update(job["id"], state=state, result=json.dumps(result, default=str))
+    return state
+
+
+def recover(api, queue: JobQueue, account: str, max_attempts: int):
+    """
+    Resolve jobs interrupted mid-call: already sent ones become submitted,
+    the others are queued again or fail once out of attempts.
+    """
+    for job in queue.select(account, ("sending", "unknown"), due_only=True):
+        try:
+            sent = was_sent(api, job)
+        except Exception as e:
+            print(f"Job {job['id']}: could not verify: {e}", file=sys.stderr)
+            continue
+
+        if sent:
+            queue.update(job["id"], state="submitted")
+        else:
+            queue.update(job["id"], state="pending" if job["attempts"] < max_attempts else "failed")
+
+
+def was_rejected(job) -> bool:
+    """
+    Whether a failed job got an answer from the API (a rejection or a failed
+    status), as opposed to a network error that left its fate open.
+    """
+    try:
+        return isinstance(json.loads(job["result"] or "null"), dict)
+    except ValueError:
+        return False
+
+
+def poll(api, queue: JobQueue, account: str):
+    for job in queue.select(account, ("submitted",)):
+        try:
+            state = completion_state(api, job)
+        except Exception as e:
+            print(f"Job {job['id']}: poll failed: {e}", file=sys.stderr)
+            continue
+
+        if state:
+            queue.update(job["id"], state=state)
+
+
+def read_job_items(path, set_items=None) -> list[dict]:
+    """
+    One domain or JSON params object per line, merged over KEY=VALUE params.
+    """
+    common = {}
+    for item in set_items or []:
+        key, sep, value = item.partition("=")
+        if not sep:
+            raise ValueError(f"Invalid --set '{item}' (use key=value)")
+        try:
+            common[key] = json.loads(value)
+        except ValueError:
+            common[key] = value
+
+    items = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            item = json.loads(line) if line.startswith("{") else {"domain": line}
+            items.append({**common, **item})
+
+    return items
+
+
+# -----------------------------
+# Commands
+# -----------------------------
+def jobs_add(account, args):
+    if args.method not in JOB_METHODS:
+        raise ValueError(f"Method must be one of: {', '.join(JOB_METHODS)}")
+
+    items = read_job_items(args.input, args.set)
+
+    queue = JobQueue(args.db)
+    try:
+        added = sum(queue.add(account, args.method, item) for item in items)
+    finally:
+        queue.close()
+
+    return {"queued": added, "duplicates": len(items) - added}
+
+
+def jobs_list(account, args):
+    queue = JobQueue(args.db)
+    try:
+        return queue.list(account, args.state)
+    finally:
+        queue.close()
+
+
+def jobs_retry(account, args):
+    queue = JobQueue(args.db)
+    try:
+        jobs = [j for j in queue.select(account, ("failed",)) if not args.id or j["id"] in args.id]
+        unverified = 0
+
+        for job in jobs:
+            # Jobs that failed on the network may have been sent after all,
+            # jobs run checks domain.log (was_sent) before sending them again
+            state = "pending" if was_rejected(job) else "unknown"
+            unverified += state == "unknown"
+            queue.update(job["id"], state=state, attempts=0, next_run=0)
+
+        return {"requeued": len(jobs), "unverified": unverified}
+    finally:
+        queue.close()
+
+
+def jobs_run(api, api_method, args):
+    account = api.account
+    queue = JobQueue(args.db)
+    limiter = RateLimiter(args.rate)
+    deadline = time.monotonic() + args.max_wait
+
+    try:
+        while True:
+            recover(api, queue, account, args.max_attempts)
+
+            pending = queue.select(account, ("pending",), due_only=True)
+            for job, state, error in run_parallel(
+                lambda j: execute(api, queue, j, args.max_attempts), pending,
+                workers=args.workers, limiter=limiter,
+            ):
+                if error:
+                    print(f"Job {job['id']}: {error}", file=sys.stderr)
+
+            poll(api, queue, account)
+
+            open_jobs = queue.select(account, ("pending", "sending", "unknown", "submitted"))
+            waiting = [j for j in open_jobs if j["state"] == "submitted"]
+
+            if not open_jobs or (args.no_wait and len(waiting) == len(open_jobs)):
+                break
+
+            # Some jobs never report a final status (e.g. renewals with scDate),
+            # they stay submitted and are polled again by the next run
+            if time.monotonic() >= deadline:
+                print(f"Stopped waiting after {args.max_wait:g}s, {len(open_jobs)} jobs still open", file=sys.stderr)
+                break
+
+            time.sleep(args.poll_interval)
+
+        counts = {}
+        for job in queue.list(account):
+            counts[job["state"]] = counts.get(job["state"], 0) + 1
+        return counts
+
+    except KeyboardInterrupt:
+        return None
+
+    finally:
+        queue.close()
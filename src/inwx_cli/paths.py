@@ -0,0 +1,9 @@
+# inwx_cli/paths.py
+
+from pathlib import Path
+
+CONFIG_DIR = Path.home() / ".config" / "inwx"
+CONFIG_FILE = CONFIG_DIR / "config.toml"
+CREDENTIALS_FILE = CONFIG_DIR / "credentials.enc"
+CACHE_DIR = Path.home() / ".cache" / "inwx"
+DATA_DIR = Path.home() / ".local" / "share" / "inwx"
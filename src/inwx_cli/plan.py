@@ -0,0 +1,283 @@
+# inwx_cli/plan.py
+
+import json
+import time
+from pathlib import Path
+from .api_core import call_checked
+from .bulk import Checkpoint, RateLimiter, run_parallel
+from .domains import domain_suffixes, tld_of
+from .exceptions import INWXAPIError
+from .jobs import idempotency_key, job_cltrid, read_job_items, was_sent
+
+PLAN_METHODS = ("domain.create", "domain.transfer")
+
+# Checkpoint value of items whose call may or may not have reached the API
+UNKNOWN = "unknown"
+
+
+def error_of(e: Exception):
+    return getattr(e, "result", None) or str(e)
+
+
+def fetch_tld_rules(api, tlds, workers: int) -> dict:
+    """
+    {tld: {"rules": ..., "extData": ..., "error": ...}} with one call per TLD and method.
+    """
+    tlds = sorted(tlds)
+    calls = [(tld, m) for tld in tlds for m in ("domain.getRules", "domain.getextradatarules")]
+    rules = {tld: {} for tld in tlds}
+
+    def fetch(call):
+        tld, api_method = call
+        return call_checked(api, api_method, {"tld": [tld]}).get("resData", {})
+
+    for (tld, api_method), res_data, error in run_parallel(fetch, calls, workers=workers):
+        if error:
+            rules[tld]["error"] = error_of(error)
+        elif api_method == "domain.getRules":
+            rules[tld]["rules"] = res_data
+        else:
+            rules[tld]["extData"] = res_data
+
+    return rules
+
+
+def known_tlds(tld_rules: dict) -> set[str]:
+    return {tld for tld, rules in tld_rules.items() if "error" not in rules and rules.get("rules")}
+
+
+def item_tld(domain: str, tld_rules: dict) -> str:
+    """
+    Longest suffix with rules ('co.uk' before 'uk'), else the last label.
+    """
+    return tld_of(domain, known_tlds(tld_rules)) or domain_suffixes(domain)[-1]
+
+
+def rule_value(rule: dict, *names):
+    lowered = {str(k).lower(): v for k, v in rule.items()}
+    for name in names:
+        if lowered.get(name.lower()) not in (None, ""):
+            return lowered[name.lower()]
+    return None
+
+
+def tld_rule(res_data, tld: str) -> dict:
+    """
+    The domain.getRules entry of one TLD.
+    """
+    if not isinstance(res_data, dict):
+        return {}
+
+    for value in res_data.values():
+        if isinstance(value, list):
+            for entry in value:
+                if isinstance(entry, dict) and str(entry.get("tld", "")).lower() == tld:
+                    return entry
+
+    return res_data if str(res_data.get("tld", "")).lower() == tld else {}
+
+
+def check_rules(domain: str, tld: str, params: dict, rule: dict) -> list[str]:
+    """
+    Label length, IDN support and registration period against the TLD rules.
+    """
+    errors = []
+    label = domain.lower().rstrip(".")[: -len(tld) - 1]
+
+    if "." in label:
+        errors.append(f"'{domain}' is not a second-level domain of .{tld}")
+
+    min_length = rule_value(rule, "minLength", "minimumLength")
+    max_length = rule_value(rule, "maxLength", "maximumLength")
+    if min_length is not None and len(label) < int(min_length):
+        errors.append(f"name is shorter than {min_length} characters")
+    if max_length is not None and len(label) > int(max_length):
+        errors.append(f"name is longer than {max_length} characters")
+
+    idn = rule_value(rule, "idn")
+    if idn is not None and str(idn).lower() in ("0", "false", "no") and not label.isascii():
+        errors.append(f".{tld} does not allow IDN names")
+
+    periods = rule_value(rule, "periods", "registrationPeriods")
+    period = params.get("period")
+    if period is not None and isinstance(periods, list) and periods:
+        allowed = {str(p).upper() for p in periods}
+        if str(period).upper() not in allowed and f"{period}Y".upper() not in allowed:
+            errors.append(f"period {period} not allowed (allowed: {', '.join(map(str, periods))})")
+
+    return errors
+
+
+def has_extdata_rules(res_data) -> bool:
+    if not res_data:
+        return False
+    return any(bool(v) for v in res_data.values()) if isinstance(res_data, dict) else bool(res_data)
+
+
+def validate_item(api, api_method: str, params: dict, tld_rules: dict) -> dict:
+    domain = params.get("domain")
+    errors = []
+    warnings = []
+
+    if not domain:
+        return {"params": params, "valid": False, "errors": ["missing domain"], "warnings": []}
+
+    tld = item_tld(domain, tld_rules)
+    rules = tld_rules.get(tld, {})
+    if "error" in rules:
+        errors.append({"domain.getRules": rules["error"]})
+    else:
+        errors.extend(check_rules(domain, tld, params, tld_rule(rules.get("rules"), tld)))
+
+    if "error" not in rules and has_extdata_rules(rules.get("extData")) and "extData" not in params:
+        warnings.append("TLD has extra data rules but no extData is given")
+
+    try:
+        check = call_checked(api, "domain.check", {"domain": [domain]})
+        entries = check.get("resData", {}).get("domain") or [{}]
+        avail = str(entries[0].get("avail", "")) in ("1", "True", "true")
+
+        if api_method == "domain.create" and not avail:
+            errors.append("domain is not available for registration")
+        if api_method == "domain.transfer" and avail:
+            errors.append("domain is not registered, nothing to transfer")
+
+    except Exception as e:
+        errors.append({"domain.check": error_of(e)})
+
+    try:
+        call_checked(api, api_method, {**params, "testing": True})
+    except INWXAPIError as e:
+        errors.append({api_method: e.result})
+    except Exception as e:
+        errors.append({api_method: str(e)})
+
+    return {"params": params, "valid": not errors, "errors": errors, "warnings": warnings}
+
+
+# -----------------------------
+# Commands
+# -----------------------------
+def domain_plan(api, api_method, args):
+    items = read_job_items(args.input, args.set)
+    # Rules of every candidate suffix, so 'example.co.uk' is checked against .co.uk
+    suffixes = {s for i in items if i.get("domain") for s in domain_suffixes(i["domain"])}
+    tld_rules = fetch_tld_rules(api, suffixes, args.workers)
+    limiter = RateLimiter(args.rate)
+
+    checked = {}
+    for index, result, error in run_parallel(
+        lambda i: validate_item(api, args.method, items[i], tld_rules), range(len(items)),
+        workers=args.workers, limiter=limiter,
+    ):
+        checked[index] = result if not error else {
+            "params": items[index], "valid": False, "errors": [error_of(error)], "warnings": [],
+        }
+
+    plan = {
+        "account": api.account,
+        "method": args.method,
+        "created": time.time(),
+        "items": [checked[i] for i in range(len(items))],
+    }
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(plan, f, indent=2, ensure_ascii=False, default=str)
+
+    invalid = [i for i in plan["items"] if not i["valid"]]
+    return {
+        "items": len(items),
+        "valid": len(items) - len(invalid),
+        "invalid": invalid,
+        "plan": args.output,
+    }
+
+
+def is_unknown(value) -> bool:
+    return isinstance(value, dict) and value.get("state") == UNKNOWN
+
+
+def apply_item(api, api_method: str, key: str, params: dict, checkpoint: Checkpoint) -> dict:
+    """
+    Send one plan item. Items left unknown by a network error are first
+    checked against domain.log, like interrupted jobs.
+    """
+    entry = checkpoint.entries.get(key)
+    job = {
+        "method": api_method,
+        "params": json.dumps(params),
+        "idempotency_key": key,
+        "sent_at": entry["sent_at"] if is_unknown(entry) else None,
+        "created_at": time.time(),
+    }
+
+    if is_unknown(entry) and was_sent(api, job):
+        checkpoint.mark(key, "sent")
+        return {"code": None, "verified": True}
+
+    sent_at = time.time()
+    try:
+        result = call_checked(api, api_method, {**params, "clTRID": job_cltrid(job)})
+    except INWXAPIError:
+        raise
+    except Exception:
+        # The request may have reached the API, verify before sending again
+        checkpoint.mark(key, {"state": UNKNOWN, "sent_at": sent_at})
+        raise
+
+    checkpoint.mark(key, result.get("code"))
+    return result
+
+
+def domain_apply(api, api_method, args):
+    with open(args.plan, encoding="utf-8") as f:
+        plan = json.load(f)
+
+    if plan["account"] != api.account:
+        raise ValueError(f"Plan was made for account '{plan['account']}', not '{api.account}'")
+
+    if plan["method"] not in PLAN_METHODS:
+        raise ValueError(f"Unsupported plan method '{plan['method']}'")
+
+    invalid = [i for i in plan["items"] if not i["valid"]]
+    if invalid and not args.skip_invalid:
+        raise ValueError(f"Plan has {len(invalid)} invalid items, use --skip-invalid to apply the rest")
+
+    # Re-running apply with the same plan never sends an item twice
+    checkpoint = Checkpoint(args.checkpoint or Path(args.plan).with_suffix(".checkpoint.jsonl"))
+    items = [
+        (idempotency_key(plan["account"], plan["method"], i["params"]), i["params"])
+        for i in plan["items"] if i["valid"]
+    ]
+    pending = [
+        (key, params) for key, params in items
+        if key not in checkpoint or is_unknown(checkpoint.entries[key])
+    ]
+    limiter = RateLimiter(args.rate)
+
+    applied = []
+    failed = []
+
+    for (key, params), result, error in run_parallel(
+        lambda item: apply_item(api, plan["method"], *item, checkpoint), pending,
+        workers=args.workers, limiter=limiter,
+    ):
+        if error:
+            failed.append({
+                "params": params,
+                "error": error_of(error),
+                "unknown": is_unknown(checkpoint.entries.get(key)),
+            })
+            continue
+
+        done = {"domain": params.get("domain"), "code": result.get("code")}
+        if result.get("verified"):
+            done["verified"] = True
+        applied.append(done)
+
+    return {
+        "applied": applied,
+        "skipped": len(items) - len(pending),
+        "invalid": len(invalid),
+        "failed": failed,
+    }
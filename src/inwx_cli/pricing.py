@@ -0,0 +1,166 @@
+# inwx_cli/pricing.py
+
+import time
+from datetime import datetime
+from collections import Counter
+from .api_core import call_checked
+from .bulk import iter_pages
+from .config import load_cache, write_cache
+from .domains import resolve_domains, tld_of
+
+PRICE_CACHE = "prices"
+DEFAULT_MAX_AGE = 24 * 3600
+
+# Price type -> field of a domain.getPrices entry
+PRICE_FIELDS = {
+    "reg": "createPrice",
+    "renewal": "renewalPrice",
+    "transfer": "transferPrice",
+    "trade": "tradePrice",
+}
+
+# Price type -> promoType of a domain.getPromos entry
+PROMO_TYPES = {
+    "reg": "REG",
+    "renewal": "RENEWAL",
+    "transfer": "TRANSFER",
+    "trade": "TRADE",
+}
+
+
+def fetch_price_table(api) -> dict:
+    prices = list(iter_pages(api, "domain.getPrices", {}, "price"))
+    promos = call_checked(api, "domain.getPromos").get("resData", {}).get("promo") or []
+
+    return {"fetched": time.time(), "prices": prices, "promos": promos}
+
+
+def load_price_table(api, max_age: float, refresh: bool = False) -> dict:
+    """
+    Price table of the account, from cache unless older than max_age seconds.
+    """
+    account = getattr(api, "account", None) or "default"
+    cache = load_cache(PRICE_CACHE)
+    table = cache.get(account)
+
+    if refresh or not table or time.time() - table["fetched"] > max_age:
+        table = fetch_price_table(api)
+        cache[account] = table
+        write_cache(PRICE_CACHE, cache)
+
+    return table
+
+
+def promo_active(promo: dict, now: datetime | None = None) -> bool:
+    """
+    Whether now lies within the promo's validity dates (open ends are valid).
+    """
+    now = now or datetime.now()
+
+    for field, inside in (("dateFrom", lambda d: d <= now), ("dateTo", lambda d: now <= d)):
+        value = promo.get(field)
+        if value in (None, ""):
+            continue
+        try:
+            date = datetime.fromisoformat(str(value)[:19])
+        except ValueError:
+            continue
+        if not inside(date):
+            return False
+
+    return True
+
+
+def index_prices(table: dict, now: datetime | None = None) -> dict:
+    """
+    {tld: {price_type: price per year, "promo": {price_type: first year price}}}
+    with only active promos that are cheaper than the regular price.
+    """
+    index = {}
+
+    for entry in table["prices"]:
+        tld = str(entry.get("tld", "")).lower()
+        index[tld] = {
+            price_type: float(entry[field])
+            for price_type, field in PRICE_FIELDS.items()
+            if entry.get(field) not in (None, "")
+        }
+        index[tld]["currency"] = entry.get("currency")
+        index[tld]["promo"] = {}
+
+    for promo in table["promos"]:
+        tld = str(promo.get("tld", "")).lower()
+        if tld not in index or promo.get("price") in (None, "") or not promo_active(promo, now):
+            continue
+
+        for price_type, promo_type in PROMO_TYPES.items():
+            if str(promo.get("promoType", "")).upper() != promo_type:
+                continue
+            current = index[tld]["promo"].get(price_type, index[tld].get(price_type))
+            if current is None or float(promo["price"]) < current:
+                index[tld]["promo"][price_type] = float(promo["price"])
+
+    return index
+
+
+def period_cost(prices: dict, price_type: str, period: int) -> float:
+    """
+    Promos only cover the first year, later years cost the regular price.
+    """
+    first = prices["promo"].get(price_type, prices[price_type])
+    return first + prices[price_type] * (period - 1)
+
+
+def estimate(domains, index: dict, price_types, periods) -> dict:
+    """
+    Cost per TLD group: prices are looked up once per TLD and multiplied
+    by the number of domains and periods, never per domain.
+    """
+    groups = Counter()
+    unpriced = []
+
+    for domain in domains:
+        tld = tld_of(domain, index)
+        if tld is None:
+            unpriced.append(domain)
+        else:
+            groups[tld] += 1
+
+    rows = []
+    totals = {}
+
+    for tld, count in sorted(groups.items()):
+        prices = index[tld]
+        row = {"tld": tld, "count": count, "currency": prices.get("currency")}
+        currency_totals = totals.setdefault(prices.get("currency"), {})
+
+        for price_type in price_types:
+            if price_type not in prices:
+                continue
+
+            row[price_type] = {}
+            by_period = currency_totals.setdefault(price_type, {str(p): 0.0 for p in periods})
+            for period in periods:
+                cost = round(period_cost(prices, price_type, period) * count, 2)
+                row[price_type][str(period)] = cost
+                by_period[str(period)] += cost
+
+        rows.append(row)
+
+    return {
+        "domains": len(domains),
+        "tlds": rows,
+        # Totals per currency, amounts in different currencies are never added up
+        "total": {
+            currency: {t: {p: round(v, 2) for p, v in by_period.items()} for t, by_period in by_type.items()}
+            for currency, by_type in totals.items()
+        },
+        "unpriced": unpriced,
+    }
+
+
+def pricing_estimate(api, api_method, args):
+    table = load_price_table(api, args.max_age, args.refresh)
+    domains = resolve_domains(api, args)
+
+    return estimate(domains, index_prices(table), args.types, args.periods)
@@ -0,0 +1,276 @@
+# inwx_cli/propagation.py
+
+import os
+import socket
+import struct
+import asyncio
+import ipaddress
+
+DNS_PORT = 53
+DEFAULT_TIMEOUT = 300
+DEFAULT_QUERY_TIMEOUT = 2.0
+DEFAULT_CONCURRENCY = 64
+INITIAL_BACKOFF = 1.0
+MAX_BACKOFF = 30.0
+
+QTYPES = {
+    "A": 1,
+    "NS": 2,
+    "CNAME": 5,
+    "PTR": 12,
+    "MX": 15,
+    "TXT": 16,
+    "AAAA": 28,
+    "SRV": 33,
+}
+QTYPE_NAMES = {v: k for k, v in QTYPES.items()}
+
+
+class DNSError(RuntimeError):
+    pass
+
+
+# -----------------------------
+# Wire format
+# -----------------------------
+def encode_name(name: str) -> bytes:
+    labels = [label for label in name.rstrip(".").split(".") if label]
+    return b"".join(bytes([len(label)]) + label.encode("idna") for label in labels) + b"\0"
+
+
+def build_query(query_id: int, name: str, record_type: str) -> bytes:
+    # flags 0: standard query, no recursion (we ask the authoritative servers)
+    header = struct.pack("!HHHHHH", query_id, 0, 1, 0, 0, 0)
+    return header + encode_name(name) + struct.pack("!HH", QTYPES[record_type], 1)
+
+
+def decode_name(data: bytes, offset: int) -> tuple[str, int]:
+    labels = []
+    end = None
+
+    for _ in range(128):
+        length = data[offset]
+
+        if length & 0xC0 == 0xC0:
+            if end is None:
+                end = offset + 2
+            offset = ((length & 0x3F) << 8) | data[offset + 1]
+            continue
+
+        offset += 1
+        if length == 0:
+            break
+
+        labels.append(data[offset:offset + length].decode("ascii", "replace"))
+        offset += length
+    else:
+        raise DNSError("name compression loop")
+
+    return ".".join(labels).lower(), end if end is not None else offset
+
+
+def decode_rdata(data: bytes, offset: int, length: int, rtype: int) -> str | None:
+    rdata = data[offset:offset + length]
+
+    if rtype == QTYPES["A"]:
+        return str(ipaddress.IPv4Address(rdata))
+    if rtype == QTYPES["AAAA"]:
+        return str(ipaddress.IPv6Address(rdata))
+    if rtype in (QTYPES["CNAME"], QTYPES["NS"], QTYPES["PTR"]):
+        return decode_name(data, offset)[0]
+    if rtype == QTYPES["MX"]:
+        # priority is compared separately, like INWX stores it
+        return decode_name(data, offset + 2)[0]
+    if rtype == QTYPES["SRV"]:
+        weight, port = struct.unpack("!HH", rdata[2:6])
+        return f"{weight} {port} {decode_name(data, offset + 6)[0]}"
+    if rtype == QTYPES["TXT"]:
+        parts = []
+        i = 0
+        while i < len(rdata):
+            parts.append(rdata[i + 1:i + 1 + rdata[i]].decode("utf-8", "replace"))
+            i += 1 + rdata[i]
+        return "".join(parts)
+
+    return None
+
+
+def parse_response(data: bytes, query_id: int) -> list[tuple[str, str]]:
+    """
+    (type, content) of all answer records.
+    """
+    if len(data) < 12:
+        raise DNSError("short response")
+
+    rid, flags, qdcount, ancount, _, _ = struct.unpack("!HHHHHH", data[:12])
+
+    if rid != query_id:
+        raise DNSError("response id mismatch")
+    if flags & 0x000F not in (0, 3):  # NOERROR, NXDOMAIN
+        raise DNSError(f"rcode {flags & 0x000F}")
+
+    offset = 12
+    for _ in range(qdcount):
+        offset = decode_name(data, offset)[1] + 4
+
+    answers = []
+    for _ in range(ancount):
+        offset = decode_name(data, offset)[1]
+        rtype, _, _, length = struct.unpack("!HHIH", data[offset:offset + 10])
+        offset += 10
+
+        content = decode_rdata(data, offset, length, rtype)
+        if content is not None:
+            answers.append((QTYPE_NAMES[rtype], content))
+        offset += length
+
+    return answers
+
+
+def normalize(record_type: str, content: str) -> str:
+    content = str(content).strip()
+
+    if record_type in ("A", "AAAA"):
+        try:
+            return str(ipaddress.ip_address(content))
+        except ValueError:
+            return content
+    if record_type in ("CNAME", "NS", "PTR", "MX"):
+        return content.rstrip(".").lower()
+    if record_type == "SRV":
+        parts = content.split()
+        if parts:
+            parts[-1] = parts[-1].rstrip(".").lower()
+        return " ".join(parts)
+    if record_type == "TXT" and len(content) >= 2 and content[0] == content[-1] == '"':
+        return content[1:-1]
+    return content
+
+
+# -----------------------------
+# asyncio UDP client
+# -----------------------------
+class _QueryProtocol(asyncio.DatagramProtocol):
+    def __init__(self, future: asyncio.Future):
+        self.future = future
+
+    def datagram_received(self, data, addr):
+        if not self.future.done():
+            self.future.set_result(data)
+
+    def error_received(self, exc):
+        if not self.future.done():
+            self.future.set_exception(exc)
+
+
+async def query(server: tuple[str, int], name: str, record_type: str,
+                timeout: float = DEFAULT_QUERY_TIMEOUT) -> list[tuple[str, str]]:
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    query_id = struct.unpack("!H", os.urandom(2))[0]
+
+    transport, _ = await loop.create_datagram_endpoint(lambda: _QueryProtocol(future), remote_addr=server)
+    try:
+        transport.sendto(build_query(query_id, name, record_type))
+        data = await asyncio.wait_for(future, timeout)
+    finally:
+        transport.close()
+
+    return parse_response(data, query_id)
+
+
+async def resolve_servers(hostnames, port: int = DNS_PORT) -> dict[str, tuple[str, int] | None]:
+    """
+    {hostname: (address, port)} using the system resolver, None if unresolvable.
+    """
+    loop = asyncio.get_running_loop()
+    servers = {}
+
+    for hostname in hostnames:
+        try:
+            ipaddress.ip_address(hostname)
+            servers[hostname] = (hostname, port)
+            continue
+        except ValueError:
+            pass
+
+        try:
+            infos = await loop.getaddrinfo(hostname, port, type=socket.SOCK_DGRAM)
+        except OSError:
+            infos = []
+        servers[hostname] = infos[0][4][:2] if infos else None
+
+    return servers
+
+
+async def wait_for_record(record: dict, server: tuple[str, int] | None, deadline: float,
+                          semaphore: asyncio.Semaphore, query_timeout: float) -> bool:
+    """
+    Query one server with exponential backoff until it serves the record
+    content or the deadline passes.
+    """
+    if server is None:
+        return False
+
+    loop = asyncio.get_running_loop()
+    record_type = record["type"].upper()
+    expected = normalize(record_type, record["content"])
+    backoff = INITIAL_BACKOFF
+
+    while True:
+        try:
+            async with semaphore:
+                answers = await query(server, record["name"], record_type, query_timeout)
+            if any(t == record_type and normalize(t, c) == expected for t, c in answers):
+                return True
+        except (OSError, asyncio.TimeoutError, DNSError):
+            pass
+
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return False
+
+        await asyncio.sleep(min(backoff, remaining))
+        backoff = min(backoff * 2, MAX_BACKOFF)
+
+
+async def verify_records_async(checks, timeout: float, port: int = DNS_PORT,
+                               concurrency: int = DEFAULT_CONCURRENCY,
+                               query_timeout: float = DEFAULT_QUERY_TIMEOUT) -> list[dict]:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def verify(record, servers):
+        supported = record["type"].upper() in QTYPES
+        results = await asyncio.gather(*(
+            wait_for_record(record, address, deadline, semaphore, query_timeout)
+            for address in servers.values()
+        )) if supported else []
+
+        return {
+            **record,
+            "servers": dict(zip(servers, results)),
+            "propagated": bool(results) and all(results) if supported else None,
+            **({} if supported else {"error": "record type not supported"}),
+        }
+
+    async def verify_zone(records, nameservers):
+        servers = await resolve_servers(nameservers, port)
+        return await asyncio.gather(*(verify(r, servers) for r in records))
+
+    results = await asyncio.gather(*(verify_zone(r, ns) for r, ns in checks))
+    return [record for zone_results in results for record in zone_results]
+
+
+def verify_records(checks, timeout: float = DEFAULT_TIMEOUT, port: int = DNS_PORT,
+                   concurrency: int = DEFAULT_CONCURRENCY) -> list[dict]:
+    """
+    Wait until every authoritative nameserver serves every record.
+
+    checks are (records, nameservers) pairs, one per zone; records are dicts
+    with fully qualified name, type and content. Returns the records with
+    per-server results and a 'propagated' flag (None for record types
+    that cannot be queried).
+    """
+    return asyncio.run(verify_records_async(checks, timeout, port, concurrency))
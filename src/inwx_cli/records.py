@@ -0,0 +1,96 @@
+# inwx_cli/records.py
+
+import sys
+from fnmatch import fnmatch
+from .api_core import call_checked
+from .bulk import Checkpoint, RateLimiter, iter_pages, run_parallel
+
+
+def list_zones(api, patterns=None) -> list[str]:
+    zones = [entry["domain"] for entry in iter_pages(api, "nameserver.list", {}, "domains")]
+
+    if not patterns:
+        return zones
+
+    return [z for z in zones if any(fnmatch(z, p) for p in patterns)]
+
+
+def find_records(api, zone, content, record_type=None) -> list[dict]:
+    params = {"domain": zone, "content": content}
+    if record_type:
+        params["type"] = record_type
+
+    result = call_checked(api, "nameserver.info", params)
+    records = result.get("resData", {}).get("record") or []
+
+    # nameserver.info filters loosely, only keep exact matches
+    return [
+        r for r in records
+        if r.get("content") == content and (not record_type or r.get("type") == record_type)
+    ]
+
+
+def build_replace_plan(api, args) -> list[dict]:
+    zones = list_zones(api, args.zones)
+    plan = []
+
+    def lookup(zone):
+        return find_records(api, zone, args.from_content, args.type)
+
+    for zone, records, error in run_parallel(lookup, zones, workers=args.workers):
+        if error:
+            raise error
+
+        for r in records:
+            plan.append({
+                "id": r["id"],
+                "domain": zone,
+                "name": r.get("name"),
+                "type": r.get("type"),
+                "from": r.get("content"),
+                "to": args.to_content,
+            })
+
+    plan.sort(key=lambda p: (p["domain"], p["name"] or "", p["id"]))
+    return plan
+
+
+def records_replace(api, api_method, args):
+    plan = build_replace_plan(api, args)
+
+    if args.dry_run:
+        return {"plan": plan}
+
+    for p in plan:
+        print(f"{p['domain']}: {p['name']} {p['type']} {p['from']} -> {p['to']}", file=sys.stderr)
+
+    checkpoint = Checkpoint(args.checkpoint)
+    pending = [p for p in plan if p["id"] not in checkpoint]
+    skipped = [p for p in plan if p["id"] in checkpoint]
+    limiter = RateLimiter(args.rate)
+
+    def apply(p):
+        params = {"id": p["id"], "content": p["to"]}
+        if args.testing:
+            params["testing"] = True
+        return call_checked(api, api_method, params)
+
+    updated = []
+    failed = []
+
+    for p, result, error in run_parallel(apply, pending, workers=args.workers, limiter=limiter):
+        if error:
+            failed.append({**p, "error": getattr(error, "result", None) or str(error)})
+            continue
+
+        # A testing run changes nothing, so a later real run must not skip it
+        if not args.testing:
+            checkpoint.mark(p["id"], result.get("code"))
+        updated.append(p)
+
+    return {
+        "plan": len(plan),
+        "updated": updated,
+        "skipped": skipped,
+        "failed": failed,
+    }
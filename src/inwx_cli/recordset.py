@@ -0,0 +1,161 @@
+# inwx_cli/recordset.py
+
+import sys
+import ipaddress
+from array import array
+
+# Record types whose content is stored as a packed integer
+ADDRESS_TYPES = {"A", "AAAA"}
+
+
+def relative_name(name: str, zone: str) -> str:
+    """
+    'www.example.com' in zone 'example.com' -> 'www', the apex -> '@'.
+    """
+    name = (name or "").rstrip(".").lower()
+    zone = zone.rstrip(".").lower()
+
+    if name in ("", zone):
+        return "@"
+    if name.endswith("." + zone):
+        return name[: -len(zone) - 1]
+    return name
+
+
+class RecordSet:
+    """
+    Column-oriented store for large numbers of DNS records.
+
+    Zone, name and type strings are interned, numeric fields live in arrays
+    and A/AAAA content is packed into integers. Records are only turned
+    into dicts when they are output.
+    """
+
+    __slots__ = ("zones", "names", "types", "contents", "ids", "ttls", "prios", "spans")
+
+    def __init__(self):
+        self.zones = []
+        self.names = []
+        self.types = []
+        self.contents = []
+        self.ids = array("q")
+        self.ttls = array("l")
+        self.prios = array("l")
+        # zone -> [[start, end], ...] index ranges
+        self.spans = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def append(self, zone: str, record: dict):
+        record_type = sys.intern(str(record.get("type", "")).upper())
+        content = record.get("content", "")
+
+        if record_type in ADDRESS_TYPES:
+            try:
+                content = int(ipaddress.ip_address(content))
+            except ValueError:
+                pass
+
+        n = len(self)
+        spans = self.spans.setdefault(zone, [])
+        if spans and spans[-1][1] == n:
+            spans[-1][1] = n + 1
+        else:
+            spans.append([n, n + 1])
+
+        self.zones.append(sys.intern(zone))
+        self.names.append(sys.intern(relative_name(record.get("name"), zone)))
+        self.types.append(record_type)
+        self.contents.append(content)
+        self.ids.append(int(record.get("id") or 0))
+        self.ttls.append(int(record.get("ttl") or 0))
+        self.prios.append(int(record.get("prio") or 0))
+
+    def extend(self, zone: str, records):
+        for record in records:
+            self.append(zone, record)
+
+    def content(self, i: int) -> str:
+        content = self.contents[i]
+        if isinstance(content, int):
+            # A and AAAA share the column, small IPv6 values would decode as IPv4
+            if self.types[i] == "AAAA":
+                return str(ipaddress.IPv6Address(content))
+            return str(ipaddress.IPv4Address(content))
+        return content
+
+    def row(self, i: int) -> dict:
+        zone = self.zones[i]
+        name = self.names[i]
+        return {
+            "id": self.ids[i],
+            "domain": zone,
+            "name": zone if name == "@" else f"{name}.{zone}",
+            "type": self.types[i],
+            "content": self.content(i),
+            "ttl": self.ttls[i],
+            "prio": self.prios[i],
+        }
+
+    def rows(self, indices=None):
+        for i in range(len(self)) if indices is None else indices:
+            yield self.row(i)
+
+    def zone_indices(self, zones):
+        """
+        Indices of the records of zones, zone by zone in the given order.
+        """
+        for zone in zones:
+            for start, end in self.spans.get(zone, []):
+                yield from range(start, end)
+
+    def find(self, name=None, record_type=None, content=None, zone=None):
+        """
+        Indices of records matching all given fields (names relative to the zone).
+        """
+        if content is not None:
+            packed = content
+            version = None
+            try:
+                address = ipaddress.ip_address(content)
+                packed, version = int(address), address.version
+            except ValueError:
+                pass
+
+        name = name.rstrip(".").lower() if name else None
+        record_type = record_type.upper() if record_type else None
+
+        indices = range(len(self)) if zone is None else self.zone_indices([zone])
+
+        for i in indices:
+            if name is not None and self.names[i] != name:
+                continue
+            if record_type is not None and self.types[i] != record_type:
+                continue
+            if content is not None and self.contents[i] != content:
+                if self.contents[i] != packed or version != (6 if self.types[i] == "AAAA" else 4):
+                    continue
+            yield i
+
+    def keys(self, zone: str) -> dict:
+        """
+        {(name, type, content, ttl, prio): index} of one zone, for comparisons.
+        """
+        return {
+            (self.names[i], self.types[i], self.contents[i], self.ttls[i], self.prios[i]): i
+            for i in self.find(zone=zone)
+        }
+
+    def diff(self, zone: str, other: "RecordSet", other_zone: str) -> dict:
+        """
+        Records only in zone ('removed') or only in other_zone ('added'),
+        compared by relative name, type, content, TTL and priority.
+        """
+        mine = self.keys(zone)
+        theirs = other.keys(other_zone)
+
+        return {
+            "added": list(other.rows(sorted(theirs[k] for k in theirs.keys() - mine.keys()))),
+            "removed": list(self.rows(sorted(mine[k] for k in mine.keys() - theirs.keys()))),
+        }
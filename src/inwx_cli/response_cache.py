@@ -0,0 +1,186 @@
+# inwx_cli/response_cache.py
+
+import os
+import json
+import time
+import sqlite3
+import threading
+from collections import OrderedDict
+from .paths import CACHE_DIR
+
+RESPONSE_DB = CACHE_DIR / "responses.sqlite"
+DEFAULT_MAXSIZE = 1024
+
+# Read-only methods that may be memoized, with their TTL in seconds
+METHOD_TTLS = {
+    "domain.getextradatarules": 86400,
+    "domain.getRules": 86400,
+    "domain.getTldGroups": 86400,
+    "domain.info": 300,
+    "domain.list": 300,
+    "domain.whois": 3600,
+    "nameserver.info": 300,
+    "nameserver.list": 300,
+}
+
+# Rules do not change when a domain or zone is written
+STATIC_METHODS = {"domain.getextradatarules", "domain.getRules", "domain.getTldGroups"}
+
+
+def canonical_params(params: dict) -> str:
+    return json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def invalidated_by(api_method: str) -> list[str]:
+    """
+    Cached methods whose results a write method may change: all non-static
+    methods of the same namespace.
+    """
+    namespace = api_method.partition(".")[0]
+    return [
+        m for m in METHOD_TTLS
+        if m.partition(".")[0] == namespace and m not in STATIC_METHODS
+    ]
+
+
+class MemoryBackend:
+    """
+    Thread-safe LRU of (account, method, params) -> (expires, result).
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.time():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, result, ttl: float):
+        with self._lock:
+            self.entries[key] = (time.time() + ttl, result)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def invalidate(self, account: str, methods):
+        with self._lock:
+            for key in [k for k in self.entries if k[0] == account and k[1] in methods]:
+                del self.entries[key]
+
+
+class DiskBackend:
+    """
+    SQLite store shared between CLI invocations.
+    """
+
+    def __init__(self, path=RESPONSE_DB):
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Cached domain.info results contain auth codes; SQLite creates the
+        # WAL and shared memory files with the permissions of the database
+        os.close(os.open(path, os.O_RDWR | os.O_CREAT, 0o600))
+        os.chmod(path, 0o600)
+
+        self.db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " account TEXT NOT NULL, method TEXT NOT NULL, params TEXT NOT NULL,"
+            " expires REAL NOT NULL, result TEXT NOT NULL,"
+            " PRIMARY KEY (account, method, params))"
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            row = self.db.execute(
+                "SELECT expires, result FROM responses WHERE account = ? AND method = ? AND params = ?", key
+            ).fetchone()
+
+        if row is None or row[0] < time.time():
+            return None
+        return json.loads(row[1])
+
+    def set(self, key, result, ttl: float):
+        with self._lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (*key, time.time() + ttl, json.dumps(result, ensure_ascii=False, default=str)),
+            )
+
+    def invalidate(self, account: str, methods):
+        methods = list(methods)
+        if not methods:
+            return
+
+        with self._lock:
+            self.db.execute(
+                f"DELETE FROM responses WHERE account = ? AND method IN ({', '.join('?' * len(methods))})",
+                (account, *methods),
+            )
+
+
+class ResponseCache:
+    """
+    Memoizes read-only API calls per account, method and params.
+    Results are looked up in each backend in order (e.g. memory, then disk).
+    """
+
+    def __init__(self, backends, ttls: dict | None = None):
+        self.backends = list(backends)
+        self.ttls = METHOD_TTLS if ttls is None else ttls
+
+    def cacheable(self, api_method: str) -> bool:
+        return api_method in self.ttls
+
+    def call(self, account: str, api_method: str, params: dict, fetch) -> dict:
+        """
+        Result of fetch(api_method, params), from cache for read-only methods.
+        Every other method is a potential write and invalidates the cached
+        methods of its namespace. Only successful results are stored.
+        """
+        if api_method not in self.ttls:
+            try:
+                return fetch(api_method, params)
+            finally:
+                for backend in self.backends:
+                    backend.invalidate(account, invalidated_by(api_method))
+
+        key = (account, api_method, canonical_params(params))
+
+        for i, backend in enumerate(self.backends):
+            result = backend.get(key)
+            if result is not None:
+                # fill faster backends
+                for faster in self.backends[:i]:
+                    faster.set(key, result, self.ttls[api_method])
+                return result
+
+        result = fetch(api_method, params)
+
+        if result.get("code") in (1000, 1001):
+            for backend in self.backends:
+                backend.set(key, result, self.ttls[api_method])
+
+        return result
+
+
+def response_cache_for(account_config: dict) -> ResponseCache:
+    """
+    In-memory cache, plus the on-disk backend if the account sets cache = "disk".
+    """
+    backends = [MemoryBackend()]
+
+    if account_config.get("cache") == "disk":
+        backends.append(DiskBackend())
+
+    return ResponseCache(backends)
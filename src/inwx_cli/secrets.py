@@ -1,6 +1,27 @@
 # inwx_cli/secrets.py
 
-import keyring
+import os
+import abc
+import sys
+import json
+import base64
+import getpass
+import hashlib
+import threading
+from pathlib import Path
+from .paths import CREDENTIALS_FILE
+
+# Environment variables used by the env and file providers
+PASSWORD_ENV = "INWX_PASSWORD"
+SHARED_SECRET_ENV = "INWX_SHARED_SECRET"
+PASSPHRASE_ENV = "INWX_CREDENTIALS_PASSPHRASE"
+
+
+def _keyring():
+    # keyring is only imported when an account actually uses it, backend
+    # discovery is slow and fails on headless machines without SecretService
+    import keyring
+    return keyring
 
 
 class SecretStore:
@@ -8,14 +29,15 @@ class SecretStore:
 
     @classmethod
     def set_password(cls, account: str, password: str):
-        keyring.set_password(cls.SERVICE, f"{account}:password", password)
+        _keyring().set_password(cls.SERVICE, f"{account}:password", password)
 
     @classmethod
     def get_password(cls, account: str) -> str | None:
-        return keyring.get_password(cls.SERVICE, f"{account}:password")
+        return _keyring().get_password(cls.SERVICE, f"{account}:password")
 
     @classmethod
     def del_password(cls, account: str) -> None:
+        keyring = _keyring()
         try:
             keyring.delete_password(cls.SERVICE, f"{account}:password")
         except keyring.errors.PasswordDeleteError:
@@ -23,16 +45,207 @@ class SecretStore:
 
     @classmethod
     def set_shared_secret(cls, account: str, secret: str):
-        keyring.set_password(cls.SERVICE, f"{account}:shared_secret", secret)
+        _keyring().set_password(cls.SERVICE, f"{account}:shared_secret", secret)
 
     @classmethod
     def get_shared_secret(cls, account: str) -> str | None:
-        return keyring.get_password(cls.SERVICE, f"{account}:shared_secret")
+        return _keyring().get_password(cls.SERVICE, f"{account}:shared_secret")
 
     @classmethod
     def del_shared_secret(cls, account: str) -> None:
+        keyring = _keyring()
         try:
             keyring.delete_password(cls.SERVICE, f"{account}:shared_secret")
         except keyring.errors.PasswordDeleteError:
             pass
 
+
+# -----------------------------
+# Encrypted credentials file
+# -----------------------------
+def _fernet(passphrase: str, salt: bytes):
+    try:
+        from cryptography.fernet import Fernet
+    except ImportError:
+        raise RuntimeError(
+            "The encrypted credentials file needs the 'cryptography' package: "
+            "pip install 'inwx-cli[encrypted]'"
+        ) from None
+
+    key = hashlib.scrypt(passphrase.encode("utf-8"), salt=salt, n=2**15, r=8, p=1, maxmem=64 * 1024 * 1024, dklen=32)
+    return Fernet(base64.urlsafe_b64encode(key))
+
+
+def read_passphrase(confirm: bool = False) -> str:
+    passphrase = os.environ.get(PASSPHRASE_ENV)
+    if passphrase:
+        return passphrase
+
+    passphrase = getpass.getpass("Credentials file passphrase: ")
+    if confirm and getpass.getpass("Repeat passphrase: ") != passphrase:
+        raise RuntimeError("Passphrases do not match")
+    return passphrase
+
+
+def read_credentials_file(path, passphrase: str) -> dict:
+    """
+    {account: {"password": ..., "shared_secret": ...}} of an encrypted file.
+    """
+    with open(path, encoding="utf-8") as f:
+        envelope = json.load(f)
+
+    fernet = _fernet(passphrase, base64.b64decode(envelope["salt"]))
+    from cryptography.fernet import InvalidToken
+
+    try:
+        return json.loads(fernet.decrypt(envelope["data"].encode("ascii")))
+    except InvalidToken:
+        raise RuntimeError(f"Wrong passphrase for credentials file {path}") from None
+
+
+def write_credentials_file(path, passphrase: str, credentials: dict):
+    path = Path(path)
+    salt = os.urandom(16)
+    token = _fernet(passphrase, salt).encrypt(json.dumps(credentials).encode("utf-8"))
+    envelope = {"version": 1, "salt": base64.b64encode(salt).decode("ascii"), "data": token.decode("ascii")}
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(envelope, f)
+
+    os.chmod(tmp, 0o600)
+    os.replace(tmp, path)
+
+
+# Decrypted files, unlocked once per process
+_unlocked = {}
+_unlock_lock = threading.Lock()
+
+
+def unlock_credentials_file(path) -> dict:
+    path = str(Path(path).expanduser())
+
+    with _unlock_lock:
+        if path not in _unlocked:
+            _unlocked[path] = read_credentials_file(path, read_passphrase())
+        return _unlocked[path]
+
+
+# -----------------------------
+# Credential providers
+# -----------------------------
+class CredentialProvider(abc.ABC):
+    """
+    Resolves the password and shared secret of one account.
+    Credentials are loaded on first use and then kept in memory.
+    """
+
+    name = None
+
+    def __init__(self, account: str, account_config: dict):
+        self.account = account
+        self.account_config = account_config
+        self._credentials = None
+        self._lock = threading.Lock()
+
+    @abc.abstractmethod
+    def load(self) -> dict:
+        """
+        {"password": ..., "shared_secret": ...} of the account.
+        """
+
+    def credentials(self) -> dict:
+        with self._lock:
+            if self._credentials is None:
+                self._credentials = self.load()
+            return self._credentials
+
+    def get_password(self) -> str | None:
+        return self.credentials().get("password")
+
+    def get_shared_secret(self) -> str | None:
+        return self.credentials().get("shared_secret")
+
+
+class KeyringProvider(CredentialProvider):
+    name = "keyring"
+
+    def load(self) -> dict:
+        return {
+            "password": SecretStore.get_password(self.account),
+            "shared_secret": SecretStore.get_shared_secret(self.account),
+        }
+
+
+class EnvProvider(CredentialProvider):
+    """
+    password_env / shared_secret_env in the account config name the variables.
+    """
+
+    name = "env"
+
+    def load(self) -> dict:
+        return {
+            "password": os.environ.get(self.account_config.get("password_env", PASSWORD_ENV)),
+            "shared_secret": os.environ.get(self.account_config.get("shared_secret_env", SHARED_SECRET_ENV)),
+        }
+
+
+class FileProvider(CredentialProvider):
+    """
+    credentials_file in the account config, default ~/.config/inwx/credentials.enc.
+    The passphrase comes from INWX_CREDENTIALS_PASSPHRASE or a prompt.
+    """
+
+    name = "file"
+
+    def load(self) -> dict:
+        path = self.account_config.get("credentials_file") or CREDENTIALS_FILE
+        return unlock_credentials_file(path).get(self.account, {})
+
+
+class StdinProvider(CredentialProvider):
+    """
+    Password on the first line of stdin, shared secret on the optional second.
+    """
+
+    name = "stdin"
+
+    def load(self) -> dict:
+        if sys.stdin.isatty():
+            password = getpass.getpass(f"Password for '{self.account}': ")
+            secret = getpass.getpass("Shared Secret (optional): ")
+        else:
+            password = sys.stdin.readline().rstrip("\r\n")
+            secret = sys.stdin.readline().rstrip("\r\n")
+
+        return {"password": password or None, "shared_secret": secret or None}
+
+
+PROVIDERS = {p.name: p for p in (KeyringProvider, EnvProvider, FileProvider, StdinProvider)}
+DEFAULT_PROVIDER = "keyring"
+
+_providers = {}
+_providers_lock = threading.Lock()
+
+
+def credential_provider_for(account: str, account_config: dict) -> CredentialProvider:
+    """
+    Provider selected by 'credentials' in the account config, one instance
+    per account and process.
+    """
+    name = account_config.get("credentials", DEFAULT_PROVIDER)
+
+    if name not in PROVIDERS:
+        raise ValueError(
+            f"Unknown credentials provider '{name}' for account '{account}' "
+            f"(choose from {', '.join(PROVIDERS)})"
+        )
+
+    with _providers_lock:
+        key = (account, name)
+        if key not in _providers:
+            _providers[key] = PROVIDERS[name](account, account_config)
+        return _providers[key]
@@ -0,0 +1,236 @@
+# inwx_cli/tracing.py
+
+import os
+import sys
+import json
+import time
+import threading
+import urllib.request
+from contextlib import contextmanager
+
+SERVICE_NAME = "inwx-cli"
+
+# Spans sent to the collector per request
+OTLP_BATCH_SIZE = 512
+
+
+class Span:
+    __slots__ = ("trace_id", "span_id", "parent_id", "name", "start", "end", "attributes", "error")
+
+    def __init__(self, name: str, parent: "Span | None", attributes: dict):
+        self.trace_id = parent.trace_id if parent else os.urandom(16).hex()
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent.span_id if parent else None
+        self.name = name
+        self.start = time.time_ns()
+        self.end = None
+        self.attributes = attributes
+        self.error = None
+
+    def set(self, **attributes):
+        self.attributes.update(attributes)
+
+    def to_dict(self) -> dict:
+        return {
+            "type": "span",
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start": self.start / 1e9,
+            "duration_ms": round((self.end - self.start) / 1e6, 3),
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+class _NoopSpan:
+    def set(self, **attributes):
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class FileExporter:
+    """
+    Appends spans and events to a JSONL file as they finish.
+    """
+
+    def __init__(self, path):
+        self.file = open(path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def export(self, record: dict):
+        line = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            self.file.write(line)
+            self.file.flush()
+
+    def shutdown(self):
+        self.file.close()
+
+
+def otlp_value(value) -> dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def otlp_attributes(attributes: dict) -> list[dict]:
+    return [{"key": k, "value": otlp_value(v)} for k, v in attributes.items() if v is not None]
+
+
+class OTLPExporter:
+    """
+    Sends spans to an OTLP/HTTP collector (JSON encoding) in batches of
+    batch_size, the rest on shutdown, so long runs do not hold every span
+    in memory. Events are only written by the file exporter.
+    """
+
+    def __init__(self, endpoint: str, batch_size: int = OTLP_BATCH_SIZE):
+        self.endpoint = endpoint.rstrip("/")
+        if not self.endpoint.endswith("/v1/traces"):
+            self.endpoint += "/v1/traces"
+        self.batch_size = batch_size
+        self.spans = []
+        self._lock = threading.Lock()
+
+    def export(self, record: dict):
+        if record["type"] != "span":
+            return
+
+        span = {
+            "traceId": record["trace_id"],
+            "spanId": record["span_id"],
+            "name": record["name"],
+            "kind": 3,  # client
+            "startTimeUnixNano": str(int(record["start"] * 1e9)),
+            "endTimeUnixNano": str(int(record["start"] * 1e9 + record["duration_ms"] * 1e6)),
+            "attributes": otlp_attributes(record["attributes"]),
+            "status": {"code": 2, "message": str(record["error"])} if record["error"] else {"code": 1},
+        }
+        if record["parent_id"]:
+            span["parentSpanId"] = record["parent_id"]
+
+        with self._lock:
+            self.spans.append(span)
+            if len(self.spans) < self.batch_size:
+                return
+            batch, self.spans = self.spans, []
+
+        try:
+            self._send(batch)
+        except OSError as e:
+            # A collector hiccup drops one batch, it must not fail the command
+            print(f"WARNING: trace export failed: {e}", file=sys.stderr)
+
+    def shutdown(self):
+        with self._lock:
+            batch, self.spans = self.spans, []
+
+        if batch:
+            self._send(batch)
+
+    def _send(self, spans: list[dict]):
+        payload = {
+            "resourceSpans": [{
+                "resource": {"attributes": otlp_attributes({"service.name": SERVICE_NAME})},
+                "scopeSpans": [{"scope": {"name": "inwx_cli"}, "spans": spans}],
+            }]
+        }
+        request = urllib.request.Request(
+            self.endpoint,
+            data=json.dumps(payload).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+        )
+        with urllib.request.urlopen(request, timeout=10):
+            pass
+
+
+class Tracer:
+    def __init__(self, exporters=None):
+        self.exporters = list(exporters or [])
+        self._local = threading.local()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.exporters)
+
+    def current(self) -> Span | None:
+        return getattr(self._local, "span", None)
+
+    @contextmanager
+    def attach(self, span: Span | None):
+        """
+        Make span the parent of spans started in this thread (e.g. worker threads).
+        """
+        previous = self.current()
+        self._local.span = span
+        try:
+            yield
+        finally:
+            self._local.span = previous
+
+    @contextmanager
+    def span(self, name: str, **attributes):
+        if not self.enabled:
+            yield _NOOP_SPAN
+            return
+
+        parent = self.current()
+        span = Span(name, parent, attributes)
+        self._local.span = span
+
+        try:
+            yield span
+        except BaseException as e:
+            span.error = getattr(e, "result", None) or f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            span.end = time.time_ns()
+            self._local.span = parent
+            self._export(span.to_dict())
+
+    def event(self, name: str, **attributes):
+        if not self.enabled:
+            return
+
+        span = self.current()
+        self._export({
+            "type": "event",
+            "name": name,
+            "time": time.time(),
+            "trace_id": span.trace_id if span else None,
+            "span_id": span.span_id if span else None,
+            "attributes": attributes,
+        })
+
+    def _export(self, record: dict):
+        for exporter in self.exporters:
+            exporter.export(record)
+
+    def shutdown(self):
+        for exporter in self.exporters:
+            try:
+                exporter.shutdown()
+            except OSError as e:
+                print(f"WARNING: trace export failed: {e}", file=sys.stderr)
+        self.exporters = []
+
+
+# Process-wide tracer, disabled until configure() is called
+tracer = Tracer()
+
+
+def configure(path=None, endpoint=None):
+    exporters = []
+    if path:
+        exporters.append(FileExporter(path))
+    if endpoint:
+        exporters.append(OTLPExporter(endpoint))
+    tracer.exporters = exporters
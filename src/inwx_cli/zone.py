@@ -0,0 +1,296 @@
+# inwx_cli/zone.py
+
+import sys
+import json
+import hashlib
+from .api_core import call_checked, handle_generic
+from .bulk import RateLimiter, run_parallel
+from .config import load_cache, write_cache
+from .domains import read_domain_file
+from .propagation import verify_records
+from .records import list_zones
+from .recordset import RecordSet, relative_name
+
+# Options added to the record write parsers, not API parameters
+PROPAGATION_ARGS = {"wait_propagated", "propagation_timeout", "nameservers", "port", "zone"}
+
+
+def fetch_zone_records(api, zone: str) -> list[dict]:
+    result = call_checked(api, "nameserver.info", {"domain": zone})
+    return result.get("resData", {}).get("record") or []
+
+
+def fetch_recordset(api, zones, workers: int, recordset: RecordSet | None = None) -> RecordSet:
+    """
+    Fetch nameserver.info of all zones in parallel into one RecordSet.
+    The decoded API results are dropped as soon as they are packed.
+    Zones are added as they arrive, read them back with zone_indices(zones)
+    for a stable order.
+    """
+    recordset = RecordSet() if recordset is None else recordset
+
+    for zone, records, error in run_parallel(lambda z: fetch_zone_records(api, z), zones, workers=workers):
+        if error:
+            raise error
+        recordset.extend(zone, records)
+
+    return recordset
+
+
+def zone_export(api, api_method, args):
+    zones = list_zones(api, args.zones)
+    recordset = fetch_recordset(api, zones, args.workers)
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+
+    try:
+        for row in recordset.rows(recordset.zone_indices(zones)):
+            out.write(json.dumps(row, ensure_ascii=False) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    return None
+
+
+def zone_search(api, api_method, args):
+    zones = list_zones(api, args.zones)
+    recordset = fetch_recordset(api, zones, args.workers)
+
+    return list(recordset.rows(
+        i for zone in zones
+        for i in recordset.find(name=args.name, record_type=args.type, content=args.content, zone=zone)
+    ))
+
+
+def zone_diff(api, api_method, args):
+    recordset = fetch_recordset(api, [args.zone, args.other], workers=2)
+
+    return recordset.diff(args.zone, recordset, args.other)
+
+
+# -----------------------------
+# Clone
+# -----------------------------
+CLONE_CACHE = "clone"
+
+# Zone specific records that never match between template and target
+CLONE_IGNORED_TYPES = {"SOA"}
+
+
+def template_keys(recordset: RecordSet, zone: str) -> dict:
+    return {k: i for k, i in recordset.keys(zone).items() if k[1] not in CLONE_IGNORED_TYPES}
+
+
+def template_fingerprint(keys) -> str:
+    return hashlib.sha256(json.dumps(sorted(keys), default=str).encode("utf-8")).hexdigest()
+
+
+def clone_target(api, template: RecordSet, source: str, keys: dict, target: str, exists: bool,
+                 limiter: RateLimiter, testing: bool) -> dict:
+    """
+    nameserver.clone for new zones. Existing zones get the template records
+    they are missing; records that only differ in TTL or priority are updated
+    in place instead of being added a second time.
+    """
+    testing_params = {"testing": True} if testing else {}
+
+    if not exists:
+        call_checked(api, "nameserver.clone", {"sourceDomain": source, "targetDomain": target, **testing_params})
+        return {"target": target, "status": "cloned"}
+
+    current = RecordSet()
+    current.extend(target, fetch_zone_records(api, target))
+    # Records are the same by name, type and content
+    existing = {k[:3]: j for k, j in current.keys(target).items()}
+    missing = []
+    changed = []
+
+    for k, i in keys.items():
+        j = existing.get(k[:3])
+        if j is None:
+            missing.append(i)
+        elif (current.ttls[j], current.prios[j]) != (template.ttls[i], template.prios[i]):
+            changed.append((i, j))
+
+    for i in missing:
+        params = {
+            "domain": target,
+            "type": template.types[i],
+            "content": template.content(i),
+            "ttl": template.ttls[i],
+            **testing_params,
+        }
+        if template.names[i] != "@":
+            params["name"] = template.names[i]
+        if template.prios[i]:
+            params["prio"] = template.prios[i]
+
+        limiter.wait()
+        call_checked(api, "nameserver.createRecord", params)
+
+    for i, j in changed:
+        params = {"id": current.ids[j], "ttl": template.ttls[i], **testing_params}
+        if template.prios[i] != current.prios[j]:
+            params["prio"] = template.prios[i]
+
+        limiter.wait()
+        call_checked(api, "nameserver.updateRecord", params)
+
+    return {
+        "target": target,
+        "status": "updated" if missing or changed else "unchanged",
+        "created": len(missing),
+        "updated": len(changed),
+    }
+
+
+def zone_clone(api, api_method, args):
+    source = args.source.lower().rstrip(".")
+    targets = list(args.targets or [])
+    if args.targets_file:
+        targets += read_domain_file(args.targets_file)
+    targets = [t for t in dict.fromkeys(t.lower().rstrip(".") for t in targets) if t != source]
+
+    if not targets:
+        raise ValueError("No targets given, use --targets or --targets-file")
+
+    template = RecordSet()
+    template.extend(source, fetch_zone_records(api, source))
+    keys = template_keys(template, source)
+    fingerprint = template_fingerprint(keys)
+
+    # Targets that matched this exact template before are not fetched again
+    account = getattr(api, "account", None) or "default"
+    cache = load_cache(CLONE_CACHE)
+    matched = cache.setdefault(account, {}).setdefault(source, {})
+
+    results = []
+    pending = []
+    for target in targets:
+        if not args.refresh and matched.get(target) == fingerprint:
+            results.append({"target": target, "status": "unchanged", "cached": True})
+        else:
+            pending.append(target)
+
+    zones = set(list_zones(api)) if pending else set()
+    limiter = RateLimiter(args.rate)
+
+    for target, result, error in run_parallel(
+        lambda t: clone_target(api, template, source, keys, t, t in zones, limiter, args.testing),
+        pending, workers=args.workers, limiter=limiter,
+    ):
+        if error:
+            results.append({"target": target, "status": "failed",
+                            "error": getattr(error, "result", None) or str(error)})
+            continue
+
+        results.append(result)
+        if not args.testing:
+            matched[target] = fingerprint
+
+    write_cache(CLONE_CACHE, cache)
+
+    order = {t: n for n, t in enumerate(targets)}
+    results.sort(key=lambda r: order[r["target"]])
+
+    return {
+        "source": source,
+        "targets": len(targets),
+        "failed": sum(r["status"] == "failed" for r in results),
+        "results": results,
+    }
+
+
+# -----------------------------
+# Propagation
+# -----------------------------
+def absolute_name(name: str, zone: str) -> str:
+    name = (name or "").rstrip(".").lower()
+    zone = zone.rstrip(".").lower()
+
+    if name in ("", "@"):
+        return zone
+    if name == zone or name.endswith("." + zone):
+        return name
+    return f"{name}.{zone}"
+
+
+def zone_nameservers(zone: str, records: list[dict]) -> list[str]:
+    """
+    Authoritative nameservers of a zone from its apex NS records.
+    """
+    return [
+        r["content"].rstrip(".") for r in records
+        if r.get("type") == "NS" and relative_name(r.get("name"), zone) == "@"
+    ]
+
+
+def propagation_check(zone: str, records: list[dict], all_records: list[dict], nameservers=None):
+    records = [
+        {
+            "id": r.get("id"),
+            "name": absolute_name(r.get("name"), zone),
+            "type": r.get("type"),
+            "content": r.get("content"),
+        }
+        for r in records
+    ]
+    return records, nameservers or zone_nameservers(zone, all_records)
+
+
+def zone_verify(api, api_method, args):
+    zones = list_zones(api, args.zones)
+    checks = []
+
+    for zone, records, error in run_parallel(lambda z: fetch_zone_records(api, z), zones, workers=args.workers):
+        if error:
+            raise error
+
+        selected = [
+            r for r in records
+            if (not args.name or relative_name(r.get("name"), zone) == args.name.lower())
+            and (not args.type or r.get("type") == args.type.upper())
+        ]
+        checks.append(propagation_check(zone, selected, records, args.nameservers))
+
+    results = verify_records(checks, timeout=args.timeout, port=args.port)
+
+    return {
+        "propagated": all(r["propagated"] is not False for r in results),
+        "records": results,
+    }
+
+
+def record_write_wait(api, api_method, args):
+    """
+    nameserver.createRecord/updateRecord, optionally waiting until the
+    authoritative nameservers serve the written record.
+    """
+    result = handle_generic(api, api_method, args, PROPAGATION_ARGS)
+
+    if not args.wait_propagated or getattr(args, "testing", False):
+        return result
+
+    if api_method == "nameserver.createRecord":
+        record_id = result.get("resData", {}).get("id")
+        params = {"domain": args.domain} if args.domain else {"roId": args.roId}
+    else:
+        if not args.zone:
+            raise ValueError("--zone is required to wait for propagation of an updated record")
+        record_id = args.id
+        params = {"domain": args.zone}
+
+    res_data = call_checked(api, "nameserver.info", params).get("resData", {})
+    zone = res_data.get("domain") or params.get("domain")
+    records = res_data.get("record") or []
+    written = [r for r in records if str(r.get("id")) == str(record_id)]
+
+    if not written:
+        raise ValueError(f"Record {record_id} not found in zone {zone}")
+
+    results = verify_records(
+        [propagation_check(zone, written, records, args.nameservers)],
+        timeout=args.propagation_timeout, port=args.port,
+    )
+
+    return {**result, "propagation": results[0]}
@@ -0,0 +1,107 @@
+import socket
+import struct
+import threading
+import ipaddress
+
+import pytest
+
+from inwx_cli.propagation import QTYPES, decode_name, verify_records
+
+
+def encode_rdata(record_type: str, content: str) -> bytes:
+    if record_type == "A":
+        return ipaddress.IPv4Address(content).packed
+    if record_type == "TXT":
+        data = content.encode("utf-8")
+        return b"".join(bytes([len(data[i:i + 255])]) + data[i:i + 255] for i in range(0, len(data), 255))
+    raise ValueError(record_type)
+
+
+class StubNameserver:
+    """
+    Authoritative UDP nameserver on 127.0.0.1 answering from a
+    {(name, type): [content]} dict, NOERROR without answers otherwise.
+    """
+
+    def __init__(self, records: dict):
+        self.records = records
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.settimeout(0.1)
+        self.port = self.sock.getsockname()[1]
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.sock.close()
+
+    def _serve(self):
+        while not self._stop.is_set():
+            try:
+                data, addr = self.sock.recvfrom(512)
+            except socket.timeout:
+                continue
+            self.sock.sendto(self.answer(data), addr)
+
+    def answer(self, data: bytes) -> bytes:
+        query_id = struct.unpack("!H", data[:2])[0]
+        name, offset = decode_name(data, 12)
+        qtype = struct.unpack("!H", data[offset:offset + 2])[0]
+        question = data[12:offset + 4]
+        record_type = next(t for t, v in QTYPES.items() if v == qtype)
+
+        answers = b""
+        contents = self.records.get((name, record_type), [])
+        for content in contents:
+            rdata = encode_rdata(record_type, content)
+            # name as a pointer to the question at offset 12
+            answers += struct.pack("!HHHIH", 0xC00C, qtype, 1, 300, len(rdata)) + rdata
+
+        header = struct.pack("!HHHHHH", query_id, 0x8400, 1, len(contents), 0, 0)
+        return header + question + answers
+
+
+@pytest.fixture
+def nameserver():
+    records = {
+        ("www.example.com", "A"): ["192.0.2.10"],
+        ("example.com", "TXT"): ["v=spf1 -all"],
+    }
+    with StubNameserver(records) as server:
+        yield server
+
+
+def test_verify_a_and_txt(nameserver):
+    checks = [([
+        {"name": "www.example.com", "type": "A", "content": "192.0.2.10"},
+        {"name": "example.com", "type": "TXT", "content": "v=spf1 -all"},
+    ], ["127.0.0.1"])]
+
+    results = verify_records(checks, timeout=5, port=nameserver.port)
+
+    assert [r["propagated"] for r in results] == [True, True]
+    assert all(r["servers"] == {"127.0.0.1": True} for r in results)
+
+
+def test_missing_record_times_out(nameserver):
+    checks = [([{"name": "missing.example.com", "type": "A", "content": "192.0.2.99"}], ["127.0.0.1"])]
+
+    results = verify_records(checks, timeout=0.5, port=nameserver.port)
+
+    assert results[0]["propagated"] is False
+    assert results[0]["servers"] == {"127.0.0.1": False}
+
+
+def test_unsupported_type_is_not_queried(nameserver):
+    checks = [([{"name": "example.com", "type": "CAA", "content": '0 issue "ca.example"'}], ["127.0.0.1"])]
+
+    results = verify_records(checks, timeout=0.5, port=nameserver.port)
+
+    assert results[0]["propagated"] is None
+    assert results[0]["error"] == "record type not supported"